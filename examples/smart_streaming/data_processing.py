@@ -6,6 +6,7 @@ for handling real-time data acquisition and visualization.
 """
 
 import time
+import functools
 import threading
 import numpy as np
 from collections import deque
@@ -168,71 +169,86 @@ def time_window_to_samples(time_window, sample_rate, downsampling_ratio):
 
 
 
-def update_plot(curve, data_array, ring_head, ring_filled, python_ring_buffer, 
-                downsampling_ratio, data_lock, data_updated):
+@functools.lru_cache(maxsize=8)
+def _scaled_x_axis(length, downsampling_ratio):
     """
-    Update the PyQtGraph plot with latest streaming data.
+    Get a cached, read-only plot x-axis in raw ADC sample space.
     
-    X-axis values are integer sample indices (in raw ADC sample space).
-    The TimeAxisItem handles conversion to time for display.
+    Args:
+        length: Number of downsampled points
+        downsampling_ratio: Raw samples per downsampled point
+        
+    Returns:
+        np.ndarray: Read-only int64 array of i * downsampling_ratio
+    """
+    x_axis = np.arange(length, dtype=np.int64) * downsampling_ratio
+    x_axis.setflags(write=False)
+    return x_axis
+
+
+def snapshot_ring_buffer(data_array, ring_head, ring_filled, python_ring_buffer):
+    """
+    Copy the ring buffer contents in logical order 0..N-1.
+    
+    The caller must hold the data lock, so the snapshot and the ring state it is
+    taken with (and any new-data flag cleared alongside it) stay consistent.
     
     Args:
-        curve: PyQtGraph plot curve object
         data_array: Circular buffer array
         ring_head: Current head position in ring buffer
         ring_filled: Number of filled samples
         python_ring_buffer: Total ring buffer size
-        downsampling_ratio: Downsampling ratio for x-axis scaling
-        data_lock: Threading lock for data access
-        data_updated: Flag indicating if new data is available
         
     Returns:
-        bool: True if plot was updated, False if no new data
+        np.ndarray: Copy of the valid samples, oldest first
     """
-    # Only update plot if new data is available
-    with data_lock:
-        if not data_updated:
-            return False
-        
-        # Update plot from ring buffer in logical order 0..N-1
-        if ring_filled < python_ring_buffer:
-            # Not full yet: show 0..ring_filled-1
-            y_vals = data_array[:ring_filled]
-            # X-axis: integer sample indices in raw ADC sample space
-            # Each downsampled point represents 'downsampling_ratio' raw samples
-            x_vals = np.arange(ring_filled, dtype=np.int64) * downsampling_ratio
-        else:
-            # Full: logical order is [ring_head..end) then [0..ring_head)
-            y_vals = np.concatenate((data_array[ring_head:], data_array[:ring_head]))
-            # X-axis: integer sample indices in raw ADC sample space
-            x_vals = np.arange(python_ring_buffer, dtype=np.int64) * downsampling_ratio
-
-        # Ensure x and y arrays have matching lengths
-        min_len = min(len(x_vals), len(y_vals))
-        if min_len == 0:
-            # No data to plot
-            data_updated = False
-            return False
-        
-        x_vals = x_vals[:min_len]
-        y_vals = y_vals[:min_len]
+    if ring_filled < python_ring_buffer:
+        # Not full yet: show 0..ring_filled-1
+        return data_array[:ring_filled].copy()
+    # Full: logical order is [ring_head..end) then [0..ring_head)
+    return np.concatenate((data_array[ring_head:], data_array[:ring_head]))
 
-        # Update scatter plot (individual points, no connecting lines)
-        # If array sizes don't match existing plot data, clear first to avoid broadcast errors
-        try:
-            curve.setData(x_vals, y_vals)
-        except ValueError as e:
-            # If there's a shape mismatch (e.g., buffer size changed), clear and reset
-            if "could not broadcast" in str(e) or "shape" in str(e).lower():
-                print(f"[WARNING] Plot buffer size mismatch detected, resetting plot: {e}")
-                curve.clear()  # Clear existing plot data
-                curve.setData(x_vals, y_vals)  # Set new data with correct size
-            else:
-                raise  # Re-raise if it's a different ValueError
+
+def update_plot(curve, y_vals, python_ring_buffer, downsampling_ratio):
+    """
+    Update the PyQtGraph plot with a ring buffer snapshot.
+    
+    X-axis values are integer sample indices (in raw ADC sample space).
+    The TimeAxisItem handles conversion to time for display. Runs without the data
+    lock so rendering never blocks the streaming thread.
+    
+    Args:
+        curve: PyQtGraph plot curve object
+        y_vals: Snapshot from snapshot_ring_buffer()
+        python_ring_buffer: Total ring buffer size
+        downsampling_ratio: Downsampling ratio for x-axis scaling
         
-        # Reset the data update flag
-        data_updated = False
-        return True
+    Returns:
+        bool: True if plot was updated, False if there was no data
+    """
+    if len(y_vals) == 0:
+        # No data to plot
+        return False
+    
+    # X-axis: integer sample indices in raw ADC sample space
+    # Each downsampled point represents 'downsampling_ratio' raw samples. The axis is
+    # shared across frames; while the buffer fills, a prefix view of it is used
+    x_vals = _scaled_x_axis(max(python_ring_buffer, len(y_vals)), downsampling_ratio)[:len(y_vals)]
+
+    # Update scatter plot (individual points, no connecting lines)
+    # If array sizes don't match existing plot data, clear first to avoid broadcast errors
+    try:
+        curve.setData(x_vals, y_vals)
+    except ValueError as e:
+        # If there's a shape mismatch (e.g., buffer size changed), clear and reset
+        if "could not broadcast" in str(e) or "shape" in str(e).lower():
+            print(f"[WARNING] Plot buffer size mismatch detected, resetting plot: {e}")
+            curve.clear()  # Clear existing plot data
+            curve.setData(x_vals, y_vals)  # Set new data with correct size
+        else:
+            raise  # Re-raise if it's a different ValueError
+    
+    return True
 
 
 @njit
@@ -23,6 +23,7 @@ Setup:
 """
 from numba import njit
 import time
+import functools
 import threading
 import sys
 import numpy as np
@@ -46,10 +47,10 @@ from ui_components import build_control_panel, STYLES, create_status_display_wid
 # Import helper modules
 from hardware_helpers import (
     calculate_sample_rate, register_double_buffers, start_streaming,
-    stop_hardware_streaming, clear_hardware_buffers,
+    stop_hardware_streaming,
     configure_default_trigger, apply_trigger_configuration,
     calculate_optimal_buffer_size, validate_buffer_size, time_to_samples,
-    TIME_UNIT_NAMES, TIME_UNIT_TO_SECONDS, get_datatype_for_mode,
+    TIME_UNIT_NAMES, TIME_UNIT_TO_SECONDS, DATA_TYPE_NAMES, get_datatype_for_mode,
     pull_raw_samples_from_device, get_trigger_position_from_device
 )
 import data_processing
@@ -63,7 +64,8 @@ from ui_helpers import (
 from ui_helpers import (
     collect_ui_settings, calculate_what_changed, validate_and_optimize_settings,
     apply_performance_settings, apply_time_window, apply_streaming_restart,
-    update_max_post_trigger_range, apply_channel_siggen_settings
+    update_max_post_trigger_range, apply_channel_siggen_settings, clear_validation_cache, settings_lock,
+    CHANGED_SETTINGS, CHANGED_PERFORMANCE, CHANGED_TRIGGER, CHANGED_CHANNEL, CHANGED_SIGGEN
 )
 
 # Custom signal for thread-safe communication
@@ -73,6 +75,7 @@ class PlotUpdateSignal(QtCore.QObject):
     buffer_status_updated = QtCore.pyqtSignal(int, int)  # current, total
     efficiency_updated = QtCore.pyqtSignal(float, float, str)  # efficiency %, jitter %, status
     trigger_fired = QtCore.pyqtSignal(int)  # trigger_at sample index
+    adc_limits_changed = QtCore.pyqtSignal(int)  # new ADC data type
 
 
 # Check Qt version for compatibility
@@ -210,6 +213,7 @@ print("Initializing PicoScope...")
 #scope = psdk.psospa()
 scope = psdk.ps6000a()
 scope.open_unit(resolution=psdk.RESOLUTION._8BIT)
+clear_validation_cache()  # Validation results are only valid for the open device
 print(f"Connected to: {scope.get_unit_serial()}")
 
 # Configure signal generator for test signal
@@ -260,17 +264,15 @@ print(f"  Initial trigger samples (at {default_adc_rate/1e6:.1f} MSPS): pre={MAX
 
 print("\nSetting up double buffers...")
 
-# Clear any existing buffers
-scope.set_data_buffer(psdk.CHANNEL.A, 0, action=psdk.ACTION.CLEAR_ALL)
-
 # Create buffers with correct datatype for the mode (AVERAGE requires INT16_T, DECIMATE can use INT8_T)
 adc_data_type, numpy_dtype = get_datatype_for_mode(INITIAL_CONFIG['downsampling_mode'])
-dtype_name = "INT16_T" if adc_data_type == psdk.DATA_TYPE.INT16_T else "INT8_T"
+dtype_name = DATA_TYPE_NAMES[adc_data_type]
 print(f"Creating buffers with datatype: {dtype_name} (mode: {'AVERAGE' if INITIAL_CONFIG['downsampling_mode'] == psdk.RATIO_MODE.AVERAGE else 'DECIMATE'})")
-buffer_0 = np.zeros(INITIAL_CONFIG['samples_per_buffer'], dtype=numpy_dtype)
-buffer_1 = np.zeros(INITIAL_CONFIG['samples_per_buffer'], dtype=numpy_dtype)
+# Uninitialised is fine: the driver fills each region before it is read
+buffer_0 = np.empty(INITIAL_CONFIG['samples_per_buffer'], dtype=numpy_dtype)
+buffer_1 = np.empty(INITIAL_CONFIG['samples_per_buffer'], dtype=numpy_dtype)
 
-# Register buffers with hardware (downsampled mode)
+# Register buffers with hardware (downsampled mode), clearing any existing registrations
 print("Registering double buffers...")
 register_double_buffers(scope, buffer_0, buffer_1, INITIAL_CONFIG['samples_per_buffer'], adc_data_type, INITIAL_CONFIG['downsampling_mode'])
 print("[OK] Double buffer setup complete")
@@ -576,10 +578,16 @@ def on_apply_button_clicked():
     global TRIGGER_ENABLED, TRIGGER_THRESHOLD_ADC, TRIGGER_DIRECTION
     global hardware_adc_sample_rate, PYTHON_RING_BUFFER
     global settings_update_in_progress
-    global data_array, x_data, ring_head, ring_filled
+    global data_array, ring_head, ring_filled
     global buffer_0, buffer_1, trigger_fired
     global PERIODIC_LOG_ENABLED, PERIODIC_LOG_FILE, PERIODIC_LOG_RATE
 
+    # The restart keeps the event loop running while it waits on hardware,
+    # so ignore further clicks until the current update has finished
+    if settings_update_in_progress:
+        print("[INFO] Settings update already in progress - Apply ignored")
+        return
+
     # Step 1: Collect all UI values
     settings = collect_ui_settings(ratio_spinbox, mode_combo, interval_spinbox, units_combo,
                                   hw_buffer_spinbox, refresh_spinbox, poll_spinbox,
@@ -622,15 +630,15 @@ def on_apply_button_clicked():
         'PERIODIC_LOG_RATE': PERIODIC_LOG_RATE
     }
 
-    settings_changed, performance_changed, time_window_changed, trigger_changed, channel_changed, siggen_changed, periodic_log_changed = calculate_what_changed(settings, current_settings)
+    changed = calculate_what_changed(settings, current_settings)
 
     # Step 3: Early exit if nothing changed
-    if not (settings_changed or performance_changed or time_window_changed or trigger_changed or siggen_changed or periodic_log_changed):
+    if not changed:
         print("No changes detected")
         return
 
     # Step 3.5: Prevent trigger changes if trigger has already fired
-    if trigger_changed and trigger_fired:
+    if changed & CHANGED_TRIGGER and trigger_fired:
         print("[ERROR] Cannot change trigger settings after trigger has fired.")
         print("  Please restart streaming manually or change other settings to restart.")
         print("  Trigger changes are disabled to prevent inconsistent behavior.")
@@ -705,11 +713,11 @@ def on_apply_button_clicked():
         return  # Validation failed, error already printed
 
     # Print calculated trigger samples after validation
-    if settings_changed and ('new_max_pre_trigger' in settings and 'new_max_post_trigger' in settings):
+    if changed & CHANGED_SETTINGS and ('new_max_pre_trigger' in settings and 'new_max_post_trigger' in settings):
         print(f"  Trigger samples (calculated): pre={settings['new_max_pre_trigger']:,}, post={settings['new_max_post_trigger']:,}")
 
     # Step 6: Apply performance settings (no restart needed)
-    if performance_changed:
+    if changed & CHANGED_PERFORMANCE:
         REFRESH_FPS, POLLING_INTERVAL = apply_performance_settings(settings, timer)
 
     # Step 6.5: Update periodic logging settings (no restart needed, applies immediately)
@@ -727,7 +735,7 @@ def on_apply_button_clicked():
 
     # Step 6.6: Apply signal generator settings immediately (no restart needed)
     # Note: Channel settings are handled during restart (Step 8) due to hardware limitations
-    if siggen_changed:
+    if changed & CHANGED_SIGGEN:
         print(f"[UPDATE] Applying signal generator settings (no restart needed)...")
         # Create settings dict with only siggen settings for immediate application
         siggen_settings = {}
@@ -752,21 +760,21 @@ def on_apply_button_clicked():
             print(f"[ERROR] Failed to apply signal generator settings")
 
     # Step 7: Handle time window changes
-    should_return, new_ring_buffer = apply_time_window(settings, settings_changed, performance_changed,
-                                                      data_lock, PYTHON_RING_BUFFER, data_array, x_data,
+    should_return, new_ring_buffer = apply_time_window(settings, bool(changed & CHANGED_SETTINGS),
+                                                      bool(changed & CHANGED_PERFORMANCE),
+                                                      data_lock, PYTHON_RING_BUFFER, data_array,
                                                       ring_head, ring_filled, hardware_adc_sample_rate,
                                                       plot, plot_signal, scope=scope)
     # Don't return early if trigger changed - trigger enable/disable requires restart
-    if should_return and not trigger_changed:
+    if should_return and not changed & CHANGED_TRIGGER:
         return
 
     # Step 8: Apply streaming restart if needed
     # Trigger enable/disable requires restart because auto_stop parameter must be set when starting streaming
-    needs_restart = settings_changed or trigger_changed
+    needs_restart = changed & (CHANGED_SETTINGS | CHANGED_TRIGGER)
 
     if needs_restart:
         # Set global flag to pause streaming thread
-        global settings_update_in_progress
         settings_update_in_progress = True
         print("Signaling streaming thread to pause for settings update...")
         time.sleep(SETTINGS_UPDATE_DELAY_SEC)  # Give thread time to see the flag
@@ -774,16 +782,53 @@ def on_apply_button_clicked():
         # Clear plot to prevent size mismatch errors when buffer size changes
         curve.clear()
 
+        # The restart stops the hardware and finishes from a timer once the stop delay
+        # has elapsed; on_streaming_restart_complete() publishes the result. The flag stays
+        # set until then so Apply, Stop, raw pulls and window close are held off.
         try:
-            success, new_rate, new_ring_buffer, new_data_array, new_x_data, new_ring_head, new_ring_filled, new_buffer_0, new_buffer_1 = apply_streaming_restart(
+            apply_streaming_restart(
                 settings, scope, buffer_0, buffer_1, data_lock,
-                PYTHON_RING_BUFFER, data_array, x_data,
+                PYTHON_RING_BUFFER, data_array,
                 ring_head, ring_filled, hardware_adc_sample_rate,
                 settings_update_event,
                 efficiency_history, perf_samples_window,
-                status_displays, plot_signal, mode_combo, cached_max_memory, plot=plot)
-            if success:
-                # Update global variables
+                status_displays, plot_signal, mode_combo, cached_max_memory, plot=plot,
+                on_complete=functools.partial(on_streaming_restart_complete, settings, changed))
+        except Exception:
+            # The restart could not be started; nothing will call on_streaming_restart_complete
+            settings_update_in_progress = False
+            settings_update_event.set()
+            raise
+    else:
+        print("[OK] Settings applied (no streaming restart needed)")
+
+
+def on_streaming_restart_complete(settings, changed, result):
+    """
+    Publish the outcome of apply_streaming_restart() once the restart has finished.
+
+    Args:
+        settings: Validated settings the restart was started with
+        changed: CHANGED_* mask computed for those settings
+        result: Result tuple from apply_streaming_restart()
+    """
+    global DOWNSAMPLING_RATIO, DOWNSAMPLING_MODE, sample_interval, time_units
+    global SAMPLES_PER_BUFFER, TARGET_TIME_WINDOW
+    global MAX_PRE_TRIGGER_SAMPLES, MAX_POST_TRIGGER_SAMPLES
+    global PRE_TRIGGER_TIME, PRE_TRIGGER_TIME_UNITS, POST_TRIGGER_TIME, POST_TRIGGER_TIME_UNITS
+    global TRIGGER_ENABLED, TRIGGER_THRESHOLD_ADC, TRIGGER_DIRECTION
+    global hardware_adc_sample_rate, PYTHON_RING_BUFFER
+    global settings_update_in_progress
+    global data_array, ring_head, ring_filled
+    global buffer_0, buffer_1, trigger_fired
+    global PERIODIC_LOG_ENABLED, PERIODIC_LOG_FILE, PERIODIC_LOG_RATE
+
+    success, new_rate, new_ring_buffer, new_data_array, new_ring_head, new_ring_filled, new_buffer_0, new_buffer_1 = result
+    try:
+        if success:
+            # Update global variables (published together so the streaming thread never
+            # sees the new ratio paired with the old ADC rate)
+            with settings_lock:
                 DOWNSAMPLING_RATIO = settings['new_ratio']
                 DOWNSAMPLING_MODE = settings['new_mode']
                 sample_interval = settings['new_interval']
@@ -796,82 +841,82 @@ def on_apply_button_clicked():
                 PRE_TRIGGER_TIME_UNITS = settings['new_pre_trigger_units']
                 POST_TRIGGER_TIME = settings['new_post_trigger_time']
                 POST_TRIGGER_TIME_UNITS = settings['new_post_trigger_units']
-
-                # Update UI spinbox to reflect validated pre-trigger time (may have been auto-adjusted)
-                # This ensures the UI shows the actual value being used
-                pre_trigger_time_spinbox.blockSignals(True)
-                pre_trigger_time_spinbox.setValue(PRE_TRIGGER_TIME)
-                pre_trigger_time_spinbox.blockSignals(False)
-                # Update channel settings in INITIAL_CONFIG if changed
-                if channel_changed:
-                    if 'new_channel_range' in settings:
-                        INITIAL_CONFIG['channel_range'] = settings['new_channel_range']
-                    if 'new_channel_coupling' in settings:
-                        INITIAL_CONFIG['channel_coupling'] = settings['new_channel_coupling']
-                    if 'new_channel_probe_scale' in settings:
-                        INITIAL_CONFIG['channel_probe_scale'] = settings['new_channel_probe_scale']
-                TRIGGER_ENABLED = settings['new_trigger_enabled']
-                TRIGGER_DIRECTION = settings['new_trigger_direction']
-                trigger_fired = False  # Reset trigger fired flag on successful restart
-
-                # Check if mode changed (which affects trigger threshold datatype)
-                old_mode = settings.get('current_mode', DOWNSAMPLING_MODE)
-                new_mode = settings['new_mode']
-                mode_changed = (old_mode != new_mode)
-
-                # Determine if new mode is INT8 (DECIMATE) or INT16 (AVERAGE)
-                is_int8_mode = (new_mode != psdk.RATIO_MODE.AVERAGE)
-
-                if mode_changed:
-                    # Mode changed - reset trigger threshold to 0 and update spinbox range
-                    TRIGGER_THRESHOLD_ADC = 0
-                    update_trigger_threshold_range(trigger_threshold_spinbox, is_int8_mode, reset_to_zero=True)
-                    print(f"[TRIGGER] Mode changed: trigger threshold reset to 0, range updated for {'INT8' if is_int8_mode else 'INT16'}")
-                else:
-                    # Mode didn't change - keep user's threshold value
-                    TRIGGER_THRESHOLD_ADC = settings['new_trigger_threshold']
                 hardware_adc_sample_rate = new_rate
-                PYTHON_RING_BUFFER = new_ring_buffer
-
-                # Update periodic logging settings (if provided)
-                if 'new_periodic_log_enabled' in settings:
-                    PERIODIC_LOG_ENABLED = settings['new_periodic_log_enabled']
-                if 'new_periodic_log_file' in settings:
-                    PERIODIC_LOG_FILE = settings['new_periodic_log_file']
-                if 'new_periodic_log_rate' in settings:
-                    PERIODIC_LOG_RATE = settings['new_periodic_log_rate']
-                if PERIODIC_LOG_ENABLED and PERIODIC_LOG_FILE:
-                    print(f"[PERIODIC LOG] Logging enabled: file={PERIODIC_LOG_FILE}, rate={PERIODIC_LOG_RATE:.2f}s")
-                else:
-                    print(f"[PERIODIC LOG] Logging disabled (enabled={PERIODIC_LOG_ENABLED}, file={PERIODIC_LOG_FILE})")
 
-                # Update time axis with new sample rate
-                # The axis handles conversion from sample indices to time for display
-                time_axis.set_sample_rate(new_rate)
-                print(f"[SETTINGS] Time axis sample rate updated: {new_rate:.2f} Hz")
-
-                # Update ring buffer arrays (critical - must update global references)
-                data_array = new_data_array
-                x_data = new_x_data
-                ring_head = new_ring_head
-                ring_filled = new_ring_filled
-                # Update hardware buffers (critical - must update global references)
-                buffer_0 = new_buffer_0
-                buffer_1 = new_buffer_1
-
-                # Update X-range to match new time window (in sample index space)
-                # TimeAxisItem converts sample indices to time for display
-                new_time_window = settings['new_time_window']
-                new_max_sample_index = time_window_to_samples(new_time_window, new_rate, DOWNSAMPLING_RATIO)
-                plot.setXRange(0, new_max_sample_index, padding=0)
-                print(f"[SETTINGS] X-axis range updated: 0 to {new_max_sample_index:,} samples ({new_time_window:.3f} seconds at {new_rate:.2f} Hz)")
-        finally:
-            # Always clear the flag and signal the thread to resume
-            settings_update_in_progress = False
-            settings_update_event.set()
-            print("Signaled streaming thread to resume")
-    else:
-        print("[OK] Settings applied (no streaming restart needed)")
+            # Update UI spinbox to reflect validated pre-trigger time (may have been auto-adjusted)
+            # This ensures the UI shows the actual value being used
+            pre_trigger_time_spinbox.blockSignals(True)
+            pre_trigger_time_spinbox.setValue(PRE_TRIGGER_TIME)
+            pre_trigger_time_spinbox.blockSignals(False)
+            # Update channel settings in INITIAL_CONFIG if changed
+            if changed & CHANGED_CHANNEL:
+                if 'new_channel_range' in settings:
+                    INITIAL_CONFIG['channel_range'] = settings['new_channel_range']
+                if 'new_channel_coupling' in settings:
+                    INITIAL_CONFIG['channel_coupling'] = settings['new_channel_coupling']
+                if 'new_channel_probe_scale' in settings:
+                    INITIAL_CONFIG['channel_probe_scale'] = settings['new_channel_probe_scale']
+            TRIGGER_ENABLED = settings['new_trigger_enabled']
+            TRIGGER_DIRECTION = settings['new_trigger_direction']
+            trigger_fired = False  # Reset trigger fired flag on successful restart
+
+            # Check if mode changed (which affects trigger threshold datatype)
+            old_mode = settings.get('current_mode', DOWNSAMPLING_MODE)
+            new_mode = settings['new_mode']
+            mode_changed = (old_mode != new_mode)
+
+            # Determine if new mode is INT8 (DECIMATE) or INT16 (AVERAGE)
+            is_int8_mode = (new_mode != psdk.RATIO_MODE.AVERAGE)
+
+            if mode_changed:
+                # Mode changed - reset trigger threshold to 0 and update spinbox range
+                TRIGGER_THRESHOLD_ADC = 0
+                update_trigger_threshold_range(trigger_threshold_spinbox, is_int8_mode, reset_to_zero=True)
+                print(f"[TRIGGER] Mode changed: trigger threshold reset to 0, range updated for {'INT8' if is_int8_mode else 'INT16'}")
+            else:
+                # Mode didn't change - keep user's threshold value
+                TRIGGER_THRESHOLD_ADC = settings['new_trigger_threshold']
+            PYTHON_RING_BUFFER = new_ring_buffer
+
+            # Update periodic logging settings (if provided)
+            if 'new_periodic_log_enabled' in settings:
+                PERIODIC_LOG_ENABLED = settings['new_periodic_log_enabled']
+            if 'new_periodic_log_file' in settings:
+                PERIODIC_LOG_FILE = settings['new_periodic_log_file']
+            if 'new_periodic_log_rate' in settings:
+                PERIODIC_LOG_RATE = settings['new_periodic_log_rate']
+            if PERIODIC_LOG_ENABLED and PERIODIC_LOG_FILE:
+                print(f"[PERIODIC LOG] Logging enabled: file={PERIODIC_LOG_FILE}, rate={PERIODIC_LOG_RATE:.2f}s")
+            else:
+                print(f"[PERIODIC LOG] Logging disabled (enabled={PERIODIC_LOG_ENABLED}, file={PERIODIC_LOG_FILE})")
+
+            # Update time axis with new sample rate
+            # The axis handles conversion from sample indices to time for display
+            time_axis.set_sample_rate(new_rate)
+            print(f"[SETTINGS] Time axis sample rate updated: {new_rate:.2f} Hz")
+
+            # Update ring buffer arrays (critical - must update global references)
+            data_array = new_data_array
+            ring_head = new_ring_head
+            ring_filled = new_ring_filled
+            # Update hardware buffers (critical - must update global references)
+            buffer_0 = new_buffer_0
+            buffer_1 = new_buffer_1
+
+            # Update X-range to match new time window (in sample index space)
+            # TimeAxisItem converts sample indices to time for display
+            new_time_window = settings['new_time_window']
+            new_max_sample_index = time_window_to_samples(new_time_window, new_rate, DOWNSAMPLING_RATIO)
+            plot.setXRange(0, new_max_sample_index, padding=0)
+            print(f"[SETTINGS] X-axis range updated: 0 to {new_max_sample_index:,} samples ({new_time_window:.3f} seconds at {new_rate:.2f} Hz)")
+    finally:
+        # Always clear the flag and signal the thread to resume
+        settings_update_in_progress = False
+        settings_update_event.set()
+        print("Signaled streaming thread to resume")
+        if close_requested:
+            # The window was closed during the restart; close it now that the scope is idle
+            QtCore.QTimer.singleShot(0, main_window.close)
 
 
 def on_stop_button_clicked():
@@ -886,6 +931,11 @@ def on_stop_button_clicked():
     global TRIGGER_ENABLED, hardware_adc_sample_rate
     global ring_head, ring_filled, data_array
 
+    # A settings restart owns the scope until it completes
+    if settings_update_in_progress:
+        print("[INFO] Settings update in progress - Stop ignored")
+        return
+
     if not streaming_stopped:
         # Normal stop path while streaming
         print("\n User requested streaming stop - stopping hardware immediately...")
@@ -923,6 +973,7 @@ def on_stop_button_clicked():
                         print(f"[RESTART] Device re-opened successfully - Connected to: {unit_serial}")
                         device_reopened = True
                         handle_valid = True
+                        clear_validation_cache()  # Cached results came from the old handle
 
                         # Restore device settings that were lost during re-open
                         print("[RESTART] Restoring device settings after re-open...")
@@ -960,10 +1011,9 @@ def on_stop_button_clicked():
                 streaming_stopped = False
                 trigger_fired = False
 
-                # Reset ring buffer state and clear data
+                # Reset ring buffer state (ring_filled = 0 invalidates the old samples)
                 try:
                     with data_lock:
-                        data_array.fill(0)
                         ring_head = 0
                         ring_filled = 0
                 except Exception as e:
@@ -986,21 +1036,18 @@ def on_stop_button_clicked():
                     print(f"[RESTART WARNING] Failed to clear plot traces: {e}")
 
                 # After get_values() in RAW mode, device may be in block capture mode
-                # Follow the same pattern as apply_streaming_restart: explicitly stop, clear, then re-register
+                # Follow the same pattern as apply_streaming_restart: explicitly stop, then clear and re-register in one call
                 print("[RESTART] Stopping device (ensuring clean state)...")
                 stop_hardware_streaming(scope)  # Explicit stop, even if already stopped
                 time.sleep(0.1)  # Brief delay for state transition
 
-                # Clear hardware buffers (this clears any RAW mode buffers from raw data pull)
-                print("[RESTART] Clearing all buffers (including RAW mode buffers)...")
-                clear_hardware_buffers(scope)
-
                 # Re-register streaming buffers (device needs to be back in streaming mode)
                 # This is critical: after get_values() in RAW mode, we must re-register streaming buffers
+                # The first registration uses CLEAR_ALL | ADD, which also drops the RAW mode buffer
                 # Get correct datatype for current mode (AVERAGE requires INT16_T, DECIMATE can use INT8_T)
                 current_adc_data_type, _ = get_datatype_for_mode(DOWNSAMPLING_MODE)
                 is_int8_mode = (current_adc_data_type == psdk.DATA_TYPE.INT8_T)
-                dtype_name = "INT16_T" if current_adc_data_type == psdk.DATA_TYPE.INT16_T else "INT8_T"
+                dtype_name = DATA_TYPE_NAMES[current_adc_data_type]
                 print(f"[RESTART] Re-registering streaming buffers ({SAMPLES_PER_BUFFER:,} samples, {DOWNSAMPLING_MODE} mode, datatype={dtype_name})...")
                 register_double_buffers(scope, buffer_0, buffer_1, SAMPLES_PER_BUFFER, current_adc_data_type, DOWNSAMPLING_MODE)
 
@@ -1200,9 +1247,8 @@ print(f"Initial ring buffer size: {PYTHON_RING_BUFFER:,} downsampled samples")
 print(f"  Time window: {TARGET_TIME_WINDOW:.1f}s, ADC rate: {hardware_adc_sample_rate:.2f} Hz, Ratio: {DOWNSAMPLING_RATIO}:1")
 
 # Pre-allocate arrays
-# Note: x_data is kept for backward compatibility with ui_helpers but is no longer used for plotting.
-# update_plot now generates integer sample indices on-the-fly; TimeAxisItem converts to time for display.
-x_data = None  # Placeholder - x values are generated on-the-fly in update_plot
+# No x-axis array is kept: update_plot generates integer sample indices on-the-fly and
+# TimeAxisItem converts them to time for display.
 data_array = np.zeros(PYTHON_RING_BUFFER, dtype=np.float32)       # Y-axis data circular buffer
 # Ring buffer state
 ring_head = 0                    # Next write index (0..PYTHON_RING_BUFFER-1)
@@ -1217,6 +1263,7 @@ streaming_stopped = False      # User stopped streaming flag
 trigger_fired = False          # Flag indicating trigger has fired and stopped streaming
 trigger_at_sample = 0           # Sample index where trigger occurred (for time alignment)
 settings_update_in_progress = False  # Settings update in progress flag
+close_requested = False              # Window closed during a settings update; close after it
 settings_update_event = threading.Event()  # Event to coordinate settings updates
 
 # Performance tracking variables
@@ -1602,7 +1649,8 @@ def streaming_thread(hardware_adc_rate):
                         perf_script_hz = 0.0
 
                 # Calculate efficiency: actual sample rate vs expected downsampled rate
-                expected_rate = hardware_adc_sample_rate / DOWNSAMPLING_RATIO  # Expected samples per second
+                with settings_lock:
+                    expected_rate = hardware_adc_sample_rate / DOWNSAMPLING_RATIO  # Expected samples per second
                 if expected_rate > 0 and perf_script_hz > 0:
                     efficiency = (perf_script_hz / expected_rate) * 100
                 else:
@@ -1693,6 +1741,8 @@ def streaming_thread(hardware_adc_rate):
             PYTHON_RING_BUFFER, data_lock, plot_signal, DOWNSAMPLING_MODE, current_adc_data_type
         )
         # Note: ring_head and ring_filled are updated from return values
+        with data_lock:
+            data_updated = True  # Plot the drained samples on the next refresh
 
     print("Data acquisition thread stopped")
 
@@ -1707,10 +1757,18 @@ def update_plot():
     """
     global data_updated, perf_plot_last_time, perf_plot_fps
 
-    # Use helper function to update plot with integer sample indices
+    # Check and clear the flag in the same critical section as the snapshot, so data the
+    # streaming thread adds after the snapshot sets the flag again for the next tick
+    with data_lock:
+        if not data_updated:
+            return
+        y_vals = data_processing.snapshot_ring_buffer(data_array, ring_head, ring_filled,
+                                                      PYTHON_RING_BUFFER)
+        data_updated = False
+
+    # Render outside the lock with integer sample indices
     # TimeAxisItem on the plot handles conversion to time for display
-    plot_updated = data_processing.update_plot(curve, data_array, ring_head, ring_filled, PYTHON_RING_BUFFER,
-                              DOWNSAMPLING_RATIO, data_lock, data_updated)
+    plot_updated = data_processing.update_plot(curve, y_vals, PYTHON_RING_BUFFER, DOWNSAMPLING_RATIO)
 
     if plot_updated:
         # Update plot FPS timing (overlay removed to reduce UI overhead)
@@ -1735,6 +1793,12 @@ def update_buffer_status_wrapper(current, total):
 # Connect signals to slots for thread-safe communication
 plot_signal.title_updated.connect(plot.setTitle)
 plot_signal.buffer_status_updated.connect(lambda current, total: update_buffer_status_wrapper(current, total))
+# Y-axis follows the ADC limits after a datatype change. Queued so it runs on the next
+# event-loop iteration, once the settings restart has returned
+plot_signal.adc_limits_changed.connect(
+    functools.partial(data_processing.update_y_axis_from_adc_limits, plot, scope),
+    QtCore.Qt.ConnectionType.QueuedConnection
+)
 
 # Region selection markers are used only for gated raw selection
 # No handler needed - on_pull_region_raw_clicked() reads region directly
@@ -1790,6 +1854,10 @@ def on_pull_raw_samples_clicked():
     global trigger_at_sample, hardware_adc_sample_rate, ring_filled, DOWNSAMPLING_RATIO, data_lock, MAX_POST_TRIGGER_SAMPLES, MAX_PRE_TRIGGER_SAMPLES
     global raw_full_data, raw_full_x_data
 
+    if settings_update_in_progress:
+        print("[INFO] Settings update in progress - raw sample pull ignored")
+        return
+
     if not trigger_fired:
         print("[ERROR] Cannot pull raw samples - trigger has not fired")
         return
@@ -2012,6 +2080,10 @@ def on_pull_region_raw_clicked():
     """
     global raw_full_data, raw_full_x_data
 
+    if settings_update_in_progress:
+        print("[RAW REGION] Settings update in progress - region pull ignored")
+        return
+
     if raw_full_data is None or raw_full_x_data is None:
         print("[RAW REGION] No cached raw data available. Pull full raw samples first.")
         return
@@ -2200,6 +2272,26 @@ print(f"Plot update timer started at {REFRESH_FPS} FPS ({refresh_interval_ms}ms)
 # MAIN EXECUTION AND CLEANUP
 # ============================================================================
 
+def on_main_window_close(event):
+    """
+    Handle the main window close event.
+
+    While a settings restart is in progress the close is deferred: the event is ignored
+    and on_streaming_restart_complete() closes the window once the scope is idle.
+
+    Args:
+        event: Qt close event
+    """
+    global close_requested
+
+    if settings_update_in_progress:
+        print("[INFO] Settings update in progress - closing once it completes")
+        close_requested = True
+        event.ignore()
+        return
+    cleanup()
+
+
 def cleanup():
     """Clean shutdown of all resources"""
     global stop_streaming, streaming_stopped
@@ -2221,6 +2313,7 @@ def cleanup():
             print("[OK] Hardware already stopped by user")
 
         scope.close_unit()
+        clear_validation_cache()
         print("[OK] PicoScope disconnected")
     except Exception as e:
         print(f"[WARNING] Error closing PicoScope: {e}")
@@ -2251,7 +2344,7 @@ try:
     print("[OK] Data acquisition thread started")
 
     # Handle window close events
-    main_window.closeEvent = lambda event: cleanup()
+    main_window.closeEvent = on_main_window_close
 
     # Start the Qt application event loop
     print("[OK] Starting Qt event loop...")
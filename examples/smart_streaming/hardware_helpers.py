@@ -6,13 +6,17 @@ PicoScope device operations, buffer management, and hardware configuration.
 """
 
 import time
+import functools
 import numpy as np
 import pypicosdk as psdk
 
 # Timing constants
-BUFFER_CLEAR_DELAY_SEC = 0.1         # Delay after clearing hardware buffers
+BUFFER_CLEAR_DELAY_SEC = 0.1         # Upper bound on the readiness wait after clearing hardware buffers
 TRIGGER_CONFIG_DELAY_SEC = 0.1       # Delay after configuring trigger
 STREAMING_STOP_DELAY_SEC = 0.5       # Delay after stopping streaming before clearing buffers
+HARDWARE_READY_TIMEOUT_SEC = 0.9     # Upper bound on the readiness wait before restarting streaming
+HARDWARE_READY_INITIAL_BACKOFF_SEC = 0.0005  # First poll interval of the readiness wait
+HARDWARE_READY_MAX_BACKOFF_SEC = 0.01        # Poll interval cap of the readiness wait
 MIN_HARDWARE_BUFFER_SAMPLES = 1000   # Minimum hardware buffer size
 TEST_TRIGGER_THRESHOLD_MV = 100      # Test threshold in mV for zero crossing trigger
 
@@ -60,6 +64,12 @@ TRIGGER_DIRECTION_NAMES = {
     psdk.TRIGGER_DIR.BELOW: 'Below'
 }
 
+# ADC data type display names for logging
+DATA_TYPE_NAMES = {
+    psdk.DATA_TYPE.INT8_T: 'INT8_T',
+    psdk.DATA_TYPE.INT16_T: 'INT16_T'
+}
+
 
 # ============================================================================
 # HARDWARE OPERATION FUNCTIONS
@@ -99,6 +109,7 @@ def time_to_samples(time_value, time_unit, sample_rate_hz):
     return int(round(samples))
 
 
+@functools.lru_cache(maxsize=16)
 def get_datatype_for_mode(downsampling_mode):
     """
     Get the correct ADC data type for a given downsampling mode.
@@ -122,10 +133,15 @@ def get_datatype_for_mode(downsampling_mode):
         return psdk.DATA_TYPE.INT8_T, np.int8
 
 
-def register_double_buffers(scope, buffer_0, buffer_1, samples_per_buffer, adc_data_type, downsampling_mode):
+def register_double_buffers(scope, buffer_0, buffer_1, samples_per_buffer, adc_data_type, downsampling_mode,
+                            clear_existing=True):
     """
     Register both hardware buffers (buffer_0 and buffer_1) with the scope.
     
+    When clear_existing is True the first registration uses CLEAR_ALL | ADD, so the
+    driver drops any previously registered buffers in the same call instead of
+    needing a separate clear_hardware_buffers() round trip.
+    
     Args:
         scope: PicoScope device instance
         buffer_0: First hardware buffer
@@ -133,11 +149,13 @@ def register_double_buffers(scope, buffer_0, buffer_1, samples_per_buffer, adc_d
         samples_per_buffer: Number of samples per buffer
         adc_data_type: ADC data type (e.g., psdk.DATA_TYPE.INT8_T)
         downsampling_mode: Downsampling mode (e.g., psdk.RATIO_MODE.DECIMATE)
+        clear_existing: Clear all existing buffer registrations with the first buffer
     """
-    for buffer in [buffer_0, buffer_1]:
+    first_action = psdk.ACTION.CLEAR_ALL | psdk.ACTION.ADD if clear_existing else psdk.ACTION.ADD
+    for action, buffer in ((first_action, buffer_0), (psdk.ACTION.ADD, buffer_1)):
         scope.set_data_buffer(
             psdk.CHANNEL.A, samples_per_buffer, buffer=buffer,
-            action=psdk.ACTION.ADD, datatype=adc_data_type,
+            action=action, datatype=adc_data_type,
             ratio_mode=downsampling_mode
         )
 
@@ -209,13 +227,41 @@ def clear_hardware_buffers(scope):
     """
     try:
         scope.set_data_buffer(psdk.CHANNEL.A, 0, action=psdk.ACTION.CLEAR_ALL)
-        time.sleep(BUFFER_CLEAR_DELAY_SEC)
+        # Return as soon as the device responds instead of always waiting the full delay
+        wait_hardware_ready(scope, timeout_sec=BUFFER_CLEAR_DELAY_SEC)
         return True
     except Exception as e:
         print(f"[WARNING] Error clearing buffers: {e}")
         return False
 
 
+def wait_hardware_ready(scope, timeout_sec=HARDWARE_READY_TIMEOUT_SEC):
+    """
+    Wait until the device answers a ping, polling with exponential backoff.
+    
+    Args:
+        scope: PicoScope device instance
+        timeout_sec: Maximum time to wait in seconds
+        
+    Returns:
+        bool: True if the device responded, False if the timeout expired
+    """
+    deadline = time.perf_counter() + timeout_sec
+    backoff = HARDWARE_READY_INITIAL_BACKOFF_SEC
+    while True:
+        try:
+            if scope.ping_unit():
+                return True
+        except Exception:
+            pass  # Device still busy - keep polling until the deadline
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            print(f"[WARNING] Device not ready after {timeout_sec:.2f}s - continuing anyway")
+            return False
+        time.sleep(min(backoff, remaining))
+        backoff = min(backoff * 2, HARDWARE_READY_MAX_BACKOFF_SEC)
+
+
 def scale_adc_threshold_to_hardware(threshold_adc, is_int8_mode):
     """
     Scale user ADC threshold to hardware 16-bit ADC value.
@@ -6,13 +6,17 @@ functions for handling user interface interactions and settings updates.
 """
 
 import time
+import threading
+import traceback
+from dataclasses import dataclass
 import numpy as np
 import pypicosdk as psdk
 from hardware_helpers import (
     calculate_sample_rate, register_double_buffers, start_streaming,
-    stop_hardware_streaming, clear_hardware_buffers, calculate_optimal_buffer_size,
+    stop_hardware_streaming, calculate_optimal_buffer_size,
     validate_buffer_size, apply_trigger_configuration, time_to_samples, TIME_UNIT_TO_SECONDS,
-    get_datatype_for_mode, MIN_RING_BUFFER_SAMPLES
+    get_datatype_for_mode, wait_hardware_ready, DATA_TYPE_NAMES, MIN_RING_BUFFER_SAMPLES,
+    STREAMING_STOP_DELAY_SEC
 )
 import data_processing
 
@@ -23,6 +27,118 @@ try:
 except ImportError:
     QT_AVAILABLE = False
 
+# Maximum stack frames printed for errors caught in the settings pipeline
+ERROR_TRACEBACK_LIMIT = 5
+
+# Guards the streaming settings shared with the streaming thread: the main script
+# publishes the new globals under it and the streaming thread reads the expected rate
+settings_lock = threading.Lock()
+
+
+# ============================================================================
+# CONSOLE OUTPUT
+# ============================================================================
+
+# Restart diagnostics are printed synchronously, in call order, so they interleave
+# correctly with the direct print() output of hardware_helpers and the main script.
+def _console_log(message, *args):
+    """
+    Print a restart diagnostic message.
+    
+    Args:
+        message: Message text, or a str.format() template if args are given
+        *args: Values formatted into message with str.format()
+    """
+    print(message.format(*args) if args else message)
+
+
+def _run_after_delay(delay_sec, callback):
+    """
+    Call callback once a fixed delay has elapsed, without freezing the Qt event loop.
+    
+    Uses a single-shot timer so the caller returns to the event loop instead of nesting
+    one, and callback runs as a fresh event rather than re-entrantly. Falls back to
+    time.sleep() and a direct call when no Qt application is running.
+    
+    Args:
+        delay_sec: Delay in seconds
+        callback: Function called with no arguments after the delay
+    """
+    if QT_AVAILABLE and QtCore.QCoreApplication.instance() is not None:
+        QtCore.QTimer.singleShot(int(delay_sec * 1000), callback)
+    else:
+        time.sleep(delay_sec)
+        callback()
+
+
+# ============================================================================
+# COMBO-BOX PAYLOAD INTERNING
+# ============================================================================
+
+# Canonical payload objects for the mode, units and trigger-direction combos. Qt may
+# return an equal but distinct object from currentData() (e.g. a plain int for an
+# IntEnum member), so collect_ui_settings() maps every payload onto these objects.
+# Together with the psdk constants used in INITIAL_CONFIG this guarantees that the
+# current and new values are the same object when unchanged, so calculate_what_changed()
+# can compare them by identity.
+_MODE_PAYLOADS = {mode: mode for mode in (psdk.RATIO_MODE.DECIMATE, psdk.RATIO_MODE.AVERAGE)}
+_UNIT_PAYLOADS = {unit: unit for unit in psdk.TIME_UNIT}
+_TRIGGER_DIR_PAYLOADS = {direction: direction for direction in (
+    psdk.TRIGGER_DIR.ABOVE, psdk.TRIGGER_DIR.BELOW, psdk.TRIGGER_DIR.RISING,
+    psdk.TRIGGER_DIR.FALLING, psdk.TRIGGER_DIR.RISING_OR_FALLING)}
+
+
+def _intern_payload(value, payloads):
+    """
+    Map a combo-box payload onto its canonical object.
+    
+    Args:
+        value: Value returned by QComboBox.currentData()
+        payloads: Canonical payload table for the combo
+    
+    Returns:
+        The canonical object equal to value, or value itself if it is not in the table
+    """
+    return payloads.get(value, value)
+
+
+# Numpy buffer dtype per downsampling mode, matching get_datatype_for_mode() (any mode
+# other than AVERAGE uses INT8_T). Used directly when reallocating buffers on restart.
+_MODE_NUMPY_DTYPE = {psdk.RATIO_MODE.AVERAGE: np.int16, psdk.RATIO_MODE.DECIMATE: np.int8}
+
+
+# ============================================================================
+# RING BUFFER SCRATCH STORAGE
+# ============================================================================
+
+# Ring buffer arrays are resliced from persistent storage on every restart instead of
+# being reallocated. The storage only grows if a larger ring buffer is requested.
+# Ring buffers are never zero-filled on reset: resetting ring_filled to 0 marks every
+# slot stale, and readers only use slots below ring_filled (all slots once it reaches
+# the buffer size, by which point each one has been rewritten).
+MAX_RING_BUFFER_SAMPLES = 1_000_000
+_data_scratch = np.empty(MAX_RING_BUFFER_SAMPLES, dtype=np.float32)
+
+
+def _get_ring_buffer_arrays(ring_buffer_size):
+    """
+    Get a ring buffer data array backed by the persistent scratch storage.
+    
+    The data array is not cleared; callers reset ring_filled to 0 instead. No x-axis
+    array is built: the plot generates sample indices on the fly.
+
+    Args:
+        ring_buffer_size: Number of samples in the ring buffer
+
+    Returns:
+        np.ndarray: View of the first ring_buffer_size scratch samples
+    """
+    global _data_scratch
+    if ring_buffer_size > len(_data_scratch):
+        _data_scratch = np.empty(ring_buffer_size, dtype=np.float32)
+    data_array = _data_scratch[:ring_buffer_size]
+    return data_array
+
 
 def apply_channel_siggen_settings(settings, scope):
     """
@@ -68,8 +184,7 @@ def apply_channel_siggen_settings(settings, scope):
         return True
     except Exception as e:
         print(f"[ERROR] Failed to apply channel/siggen settings: {e}")
-        import traceback
-        traceback.print_exc()
+        traceback.print_exc(limit=ERROR_TRACEBACK_LIMIT)
         return False
 
 
@@ -106,9 +221,9 @@ def collect_ui_settings(ratio_spinbox, mode_combo, interval_spinbox, units_combo
     """
     settings = {
         'new_ratio': ratio_spinbox.value(),
-        'new_mode': mode_combo.currentData(),
+        'new_mode': _intern_payload(mode_combo.currentData(), _MODE_PAYLOADS),
         'new_interval': interval_spinbox.value(),
-        'new_units': units_combo.currentData(),
+        'new_units': _intern_payload(units_combo.currentData(), _UNIT_PAYLOADS),
         'new_buffer_size': hw_buffer_spinbox.value(),
         'new_refresh_fps': refresh_spinbox.value(),
         'new_poll_interval': poll_spinbox.value() / 1000.0,  # Convert ms to seconds
@@ -119,7 +234,7 @@ def collect_ui_settings(ratio_spinbox, mode_combo, interval_spinbox, units_combo
         'new_post_trigger_units': trigger_units_combo.currentData(),  # Same shared units combo
         'new_trigger_enabled': trigger_enable_checkbox.isChecked(),
         'new_trigger_threshold': trigger_threshold_spinbox.value(),
-        'new_trigger_direction': trigger_direction_combo.currentData()  # Get direction value from combo
+        'new_trigger_direction': _intern_payload(trigger_direction_combo.currentData(), _TRIGGER_DIR_PAYLOADS)
     }
     
     # Add periodic logging settings if widgets are provided
@@ -147,90 +262,170 @@ def collect_ui_settings(ratio_spinbox, mode_combo, interval_spinbox, units_combo
     return settings
 
 
+@dataclass(frozen=True, slots=True)
+class ChannelSiggenState:
+    "Channel and signal generator configuration, compared as a single value"
+    range: object
+    coupling: object
+    probe: float
+    siggen_freq: float
+    siggen_pk2pk: float
+    siggen_wave: object
+
+    @classmethod
+    def from_current_settings(cls, current_settings):
+        """
+        Build the state currently applied to the hardware.
+        
+        Args:
+            current_settings: Dictionary of current settings
+        
+        Returns:
+            ChannelSiggenState: Current channel and signal generator state
+        """
+        return cls(
+            range=current_settings.get('channel_range'),
+            coupling=current_settings.get('channel_coupling'),
+            probe=current_settings.get('channel_probe_scale'),
+            siggen_freq=current_settings.get('siggen_frequency'),
+            siggen_pk2pk=current_settings.get('siggen_pk2pk'),
+            siggen_wave=current_settings.get('siggen_wave_type'),
+        )
+
+    def updated_from(self, settings):
+        """
+        Build the state requested by the UI; values the UI did not provide are kept.
+        
+        Args:
+            settings: Dictionary of new settings from UI
+        
+        Returns:
+            ChannelSiggenState: Requested channel and signal generator state
+        """
+        return ChannelSiggenState(
+            range=settings.get('new_channel_range', self.range),
+            coupling=settings.get('new_channel_coupling', self.coupling),
+            probe=settings.get('new_channel_probe_scale', self.probe),
+            siggen_freq=settings.get('new_siggen_frequency', self.siggen_freq),
+            siggen_pk2pk=settings.get('new_siggen_pk2pk', self.siggen_pk2pk),
+            siggen_wave=settings.get('new_siggen_wave_type', self.siggen_wave),
+        )
+
+
+# Change flags returned by calculate_what_changed as a single bitmask
+CHANGED_SETTINGS = 1       # Streaming settings (restart required)
+CHANGED_PERFORMANCE = 2    # Refresh rate / polling interval
+CHANGED_TIME_WINDOW = 4    # Display time window
+CHANGED_TRIGGER = 8        # Trigger enable/threshold/direction (restart required)
+CHANGED_CHANNEL = 16       # Channel range/coupling/probe (restart required, implies CHANGED_SETTINGS)
+CHANGED_SIGGEN = 32        # Signal generator (applied immediately)
+CHANGED_PERIODIC_LOG = 64  # Periodic logging (applied immediately)
+
+# Optional settings compared by calculate_what_changed: (new_key, current_key, current_default)
+_PERIODIC_LOG_KEYS = (
+    ('new_periodic_log_enabled', 'PERIODIC_LOG_ENABLED', False),
+    ('new_periodic_log_file', 'PERIODIC_LOG_FILE', ''),
+    ('new_periodic_log_rate', 'PERIODIC_LOG_RATE', 1.0),
+)
+
+
+def _any_changed(settings, current_settings, keys):
+    """
+    Check whether any optional setting present in the UI settings differs from its current value.
+    
+    Args:
+        settings: Dictionary of new settings from UI
+        current_settings: Dictionary of current settings
+        keys: Tuple of (new_key, current_key, current_default) entries
+    
+    Returns:
+        bool: True if at least one provided setting changed
+    """
+    return any(new_key in settings and settings[new_key] != current_settings.get(current_key, default)
+               for new_key, current_key, default in keys)
+
+
 def calculate_what_changed(settings, current_settings):
     """
     Determine which settings have changed.
     
+    Mode, time units and trigger direction are compared by identity. This relies on
+    collect_ui_settings() interning those payloads and on the current values only ever
+    being psdk constants or previously interned payloads.
+    
     Args:
         settings: Dictionary of new settings from UI
         current_settings: Dictionary of current settings
     
     Returns:
-        tuple: (settings_changed, performance_changed, time_window_changed, trigger_changed, channel_changed, siggen_changed, periodic_log_changed)
+        int: Bitmask of CHANGED_* flags, 0 if nothing changed
     """
-    # Channel changes require restart (hardware limitation: half-duplex USB)
-    channel_changed = False
-    if 'new_channel_range' in settings:
-        channel_changed = channel_changed or (
-            settings['new_channel_range'] != current_settings.get('channel_range')
-        )
-    if 'new_channel_coupling' in settings:
-        channel_changed = channel_changed or (
-            settings['new_channel_coupling'] != current_settings.get('channel_coupling')
-        )
-    if 'new_channel_probe_scale' in settings:
-        channel_changed = channel_changed or (
-            settings['new_channel_probe_scale'] != current_settings.get('channel_probe_scale')
-        )
+    mask = 0
     
-    # Signal generator changes can be applied immediately (no restart needed)
-    siggen_changed = False
-    if 'new_siggen_frequency' in settings:
-        siggen_changed = siggen_changed or (
-            settings['new_siggen_frequency'] != current_settings.get('siggen_frequency')
-        )
-    if 'new_siggen_pk2pk' in settings:
-        siggen_changed = siggen_changed or (
-            settings['new_siggen_pk2pk'] != current_settings.get('siggen_pk2pk')
-        )
-    if 'new_siggen_wave_type' in settings:
-        siggen_changed = siggen_changed or (
-            settings['new_siggen_wave_type'] != current_settings.get('siggen_wave_type')
-        )
+    # Compare channel and sig gen state as one value; only split when something differs
+    current_state = ChannelSiggenState.from_current_settings(current_settings)
+    new_state = current_state.updated_from(settings)
+    if new_state != current_state:
+        # Channel changes require restart (hardware limitation: half-duplex USB)
+        if ((new_state.range, new_state.coupling, new_state.probe) !=
+                (current_state.range, current_state.coupling, current_state.probe)):
+            mask |= CHANGED_CHANNEL | CHANGED_SETTINGS
+        # Signal generator changes can be applied immediately (no restart needed)
+        if ((new_state.siggen_freq, new_state.siggen_pk2pk, new_state.siggen_wave) !=
+                (current_state.siggen_freq, current_state.siggen_pk2pk, current_state.siggen_wave)):
+            mask |= CHANGED_SIGGEN
     
     # Periodic logging changes can be applied immediately (no restart needed)
-    periodic_log_changed = False
-    if 'new_periodic_log_enabled' in settings:
-        periodic_log_changed = periodic_log_changed or (
-            settings['new_periodic_log_enabled'] != current_settings.get('PERIODIC_LOG_ENABLED', False)
-        )
-    if 'new_periodic_log_file' in settings:
-        periodic_log_changed = periodic_log_changed or (
-            settings['new_periodic_log_file'] != current_settings.get('PERIODIC_LOG_FILE', '')
-        )
-    if 'new_periodic_log_rate' in settings:
-        periodic_log_changed = periodic_log_changed or (
-            settings['new_periodic_log_rate'] != current_settings.get('PERIODIC_LOG_RATE', 1.0)
-        )
+    if _any_changed(settings, current_settings, _PERIODIC_LOG_KEYS):
+        mask |= CHANGED_PERIODIC_LOG
     
     # Streaming settings that require restart
-    settings_changed = (
+    if (
         settings['new_ratio'] != current_settings['DOWNSAMPLING_RATIO'] or
-        settings['new_mode'] != current_settings['DOWNSAMPLING_MODE'] or
+        settings['new_mode'] is not current_settings['DOWNSAMPLING_MODE'] or  # Interned payload
         settings['new_interval'] != current_settings['sample_interval'] or
-        settings['new_units'] != current_settings['time_units'] or
+        settings['new_units'] is not current_settings['time_units'] or  # Interned payload
         settings['new_buffer_size'] != current_settings['SAMPLES_PER_BUFFER'] or
         settings['new_pre_trigger_time'] != current_settings.get('PRE_TRIGGER_TIME', 0.0) or
         settings['new_pre_trigger_units'] != current_settings.get('PRE_TRIGGER_TIME_UNITS', psdk.TIME_UNIT.MS) or
         settings['new_post_trigger_time'] != current_settings.get('POST_TRIGGER_TIME', 1.0) or
-        settings['new_post_trigger_units'] != current_settings.get('POST_TRIGGER_TIME_UNITS', psdk.TIME_UNIT.MS) or
-        channel_changed  # Channel changes require restart
-    )
+        settings['new_post_trigger_units'] != current_settings.get('POST_TRIGGER_TIME_UNITS', psdk.TIME_UNIT.MS)
+    ):
+        mask |= CHANGED_SETTINGS
     
-    performance_changed = (
+    if (
         settings['new_refresh_fps'] != current_settings['REFRESH_FPS'] or
         settings['new_poll_interval'] != current_settings['POLLING_INTERVAL']
-    )
+    ):
+        mask |= CHANGED_PERFORMANCE
     
-    time_window_changed = (settings['new_time_window'] != current_settings['TARGET_TIME_WINDOW'])
+    if settings['new_time_window'] != current_settings['TARGET_TIME_WINDOW']:
+        mask |= CHANGED_TIME_WINDOW
     
-    trigger_changed = (
+    if (
         settings['new_trigger_enabled'] != current_settings['TRIGGER_ENABLED'] or
         settings['new_trigger_threshold'] != current_settings['TRIGGER_THRESHOLD_ADC'] or
-        settings['new_trigger_direction'] != current_settings.get('TRIGGER_DIRECTION', psdk.TRIGGER_DIR.RISING_OR_FALLING)
-    )
+        settings['new_trigger_direction'] is not current_settings.get('TRIGGER_DIRECTION', psdk.TRIGGER_DIR.RISING_OR_FALLING)  # Interned payload
+    ):
+        mask |= CHANGED_TRIGGER
     
-    return settings_changed, performance_changed, time_window_changed, trigger_changed, channel_changed, siggen_changed, periodic_log_changed
+    return mask
+
+
+# Last validate_and_optimize_settings result and the inputs it depends on, so repeated
+# applies that do not touch those inputs (e.g. time window only) skip the device query.
+# A single entry keeps the cache bounded; it is cleared whenever the device opens or closes.
+_last_validation_key = None
+_last_validation_result = None
+
+
+def clear_validation_cache():
+    """
+    Drop the cached validation result (call when the device is opened or closed).
+    """
+    global _last_validation_key, _last_validation_result
+    _last_validation_key = None
+    _last_validation_result = None
 
 
 def validate_and_optimize_settings(settings, cached_max_memory, hw_buffer_spinbox, hardware_adc_sample_rate, scope=None):
@@ -247,25 +442,49 @@ def validate_and_optimize_settings(settings, cached_max_memory, hw_buffer_spinbo
     Returns:
         tuple: (is_valid, updated_settings)
     """
+    global _last_validation_key, _last_validation_result
+    # Read every input once; the results are written back to settings at the end
     new_ratio = settings['new_ratio']
     new_buffer_size = settings['new_buffer_size']
-    ratio_changed = (new_ratio != settings.get('current_ratio', new_ratio))
-    buffer_size_changed = (new_buffer_size != settings.get('current_buffer_size', new_buffer_size))
+    new_interval = settings['new_interval']
+    new_units = settings['new_units']
+    pre_trigger_time = settings['new_pre_trigger_time']
+    pre_trigger_units = settings['new_pre_trigger_units']
+    post_trigger_time = settings['new_post_trigger_time']
+    post_trigger_units = settings['new_post_trigger_units']
+    poll_interval_seconds = settings.get('new_poll_interval', 0.001)  # Default to 1ms if not set
+    current_ratio = settings.get('current_ratio', new_ratio)
+    ratio_changed = (new_ratio != current_ratio)
+    
+    cache_key = (new_interval, new_units, new_ratio, new_buffer_size,
+                 pre_trigger_time, pre_trigger_units, post_trigger_time, post_trigger_units,
+                 poll_interval_seconds, current_ratio, cached_max_memory,
+                 hardware_adc_sample_rate, scope is not None)
+    cached = _last_validation_result if cache_key == _last_validation_key else None
+    if cached is not None:
+        if hw_buffer_spinbox is not None and cached['new_buffer_size'] != new_buffer_size:
+            hw_buffer_spinbox.blockSignals(True)
+            hw_buffer_spinbox.setValue(cached['new_buffer_size'])
+            hw_buffer_spinbox.blockSignals(False)
+        settings.update(cached)
+        print("[VALIDATION] Inputs unchanged since last validation - using cached result")
+        return True, settings
     
     # Auto-calculate optimal buffer size if ratio changed
     if ratio_changed and cached_max_memory is not None:
         optimal_buffer_size = calculate_optimal_buffer_size(cached_max_memory, new_ratio)
-        print(f"[VALIDATION] Ratio changed: {settings.get('current_ratio', new_ratio)} -> {new_ratio}")
+        print(f"[VALIDATION] Ratio changed: {current_ratio} -> {new_ratio}")
         print(f"[VALIDATION] Auto-calculating optimal buffer size: {optimal_buffer_size:,} samples")
         
         # Update buffer size to optimal value
-        settings['new_buffer_size'] = optimal_buffer_size
         new_buffer_size = optimal_buffer_size
-        buffer_size_changed = True
         
-        # Update the UI spinbox if provided
+        # Update the UI spinbox if provided (signals blocked so the programmatic
+        # update does not re-enter the settings pipeline)
         if hw_buffer_spinbox is not None:
+            hw_buffer_spinbox.blockSignals(True)
             hw_buffer_spinbox.setValue(optimal_buffer_size)
+            hw_buffer_spinbox.blockSignals(False)
             print(f"[VALIDATION] Updated buffer size spinbox to {optimal_buffer_size:,} samples")
     
     # Convert trigger times to samples for validation
@@ -274,37 +493,29 @@ def validate_and_optimize_settings(settings, cached_max_memory, hw_buffer_spinbo
     if scope is not None:
         # Get actual interval that device will achieve using wrapper function
         # Convert requested interval to seconds for get_nearest_sampling_interval()
-        unit_to_seconds = TIME_UNIT_TO_SECONDS.get(settings['new_units'], 1.0)
-        requested_interval_s = settings['new_interval'] * unit_to_seconds
+        unit_to_seconds = TIME_UNIT_TO_SECONDS.get(new_units, 1.0)
+        requested_interval_s = new_interval * unit_to_seconds
         nearest_interval_dict = scope.get_nearest_sampling_interval(requested_interval_s)
         actual_interval_s = nearest_interval_dict['actual_sample_interval']
         
         # Calculate actual sample rate from device-returned actual interval
         actual_new_rate = 1.0 / actual_interval_s  # Rate in Hz
-        print(f"[VALIDATION] Device actual interval: {actual_interval_s*1e9:.2f} ns (requested: {settings['new_interval']} {settings['new_units']})")
+        print(f"[VALIDATION] Device actual interval: {actual_interval_s*1e9:.2f} ns (requested: {new_interval} {new_units})")
         print(f"[VALIDATION] Device actual rate: {actual_new_rate/1e6:.3f} MSPS")
         
         rate_to_use = actual_new_rate
     else:
         # Fallback to expected rate if scope not available
-        rate_to_use = calculate_sample_rate(settings['new_interval'], settings['new_units'])
+        rate_to_use = calculate_sample_rate(new_interval, new_units)
         print(f"[VALIDATION] Using expected rate (scope not available): {rate_to_use/1e6:.3f} MSPS")
     
-    new_pre_trigger_samples = time_to_samples(
-        settings['new_pre_trigger_time'], 
-        settings['new_pre_trigger_units'], 
-        rate_to_use  # Use actual device rate if available, otherwise expected rate
-    )
-    new_post_trigger_samples = time_to_samples(
-        settings['new_post_trigger_time'], 
-        settings['new_post_trigger_units'], 
-        rate_to_use  # Use actual device rate if available, otherwise expected rate
-    )
+    # Use actual device rate if available, otherwise expected rate
+    new_pre_trigger_samples = time_to_samples(pre_trigger_time, pre_trigger_units, rate_to_use)
+    new_post_trigger_samples = time_to_samples(post_trigger_time, post_trigger_units, rate_to_use)
     
     # Validate minimum pre-trigger based on poll interval
     # Minimum pre-trigger must be at least one poll interval worth of samples
     # This ensures we capture data from before the trigger even if trigger fires right after a poll
-    poll_interval_seconds = settings.get('new_poll_interval', 0.001)  # Default to 1ms if not set
     min_pre_trigger_samples = int(poll_interval_seconds * rate_to_use)
     
     if new_pre_trigger_samples < min_pre_trigger_samples:
@@ -315,32 +526,33 @@ def validate_and_optimize_settings(settings, cached_max_memory, hw_buffer_spinbo
         # Convert minimum samples back to time for user display
         min_pre_trigger_time_seconds = min_pre_trigger_samples / rate_to_use
         # Use the same units as user's current setting for consistency
-        unit_to_seconds = TIME_UNIT_TO_SECONDS.get(settings['new_pre_trigger_units'], 1.0)
-        min_pre_trigger_time = min_pre_trigger_time_seconds / unit_to_seconds
+        unit_to_seconds = TIME_UNIT_TO_SECONDS.get(pre_trigger_units, 1.0)
+        pre_trigger_time = min_pre_trigger_time_seconds / unit_to_seconds
         
-        print(f"[VALIDATION]   Minimum pre-trigger time: {min_pre_trigger_time:.6f} {settings['new_pre_trigger_units']}")
+        print(f"[VALIDATION]   Minimum pre-trigger time: {pre_trigger_time:.6f} {pre_trigger_units}")
         
         # Update to minimum
         new_pre_trigger_samples = min_pre_trigger_samples
-        settings['new_pre_trigger_time'] = min_pre_trigger_time
     else:
         print(f"[VALIDATION] Pre-trigger samples ({new_pre_trigger_samples:,}) meets minimum requirement ({min_pre_trigger_samples:,})")
     
-    # Store sample values for use in hardware calls
+    # Store validated values for use in hardware calls
+    settings['new_buffer_size'] = new_buffer_size
+    settings['new_pre_trigger_time'] = pre_trigger_time
     settings['new_max_pre_trigger'] = new_pre_trigger_samples
     settings['new_max_post_trigger'] = new_post_trigger_samples
     
     # Note: update_max_post_trigger_range is now called from main file after UI widgets are available
     
     # Validate memory requirements
-    memory_required = settings['new_buffer_size'] * new_ratio
+    memory_required = new_buffer_size * new_ratio
     if cached_max_memory is not None:
-        is_valid, _, _ = validate_buffer_size(settings['new_buffer_size'], new_ratio, cached_max_memory)
+        is_valid, _, _ = validate_buffer_size(new_buffer_size, new_ratio, cached_max_memory)
         if not is_valid:
-            print(f"[VALIDATION] Buffer size validation failed: buffer={settings['new_buffer_size']:,}, ratio={new_ratio}, memory_required={memory_required:,}, max_memory={cached_max_memory:,}")
+            print(f"[VALIDATION] Buffer size validation failed: buffer={new_buffer_size:,}, ratio={new_ratio}, memory_required={memory_required:,}, max_memory={cached_max_memory:,}")
             return False, settings
         else:
-            print(f"[VALIDATION] Buffer size validation passed: buffer={settings['new_buffer_size']:,}, ratio={new_ratio}, memory_required={memory_required:,}")
+            print(f"[VALIDATION] Buffer size validation passed: buffer={new_buffer_size:,}, ratio={new_ratio}, memory_required={memory_required:,}")
     else:
         print(f"[WARNING] WARNING: Cannot verify memory safety (max memory unknown)")
         print(f"  Will attempt to use {memory_required:,} samples")
@@ -361,6 +573,13 @@ def validate_and_optimize_settings(settings, cached_max_memory, hw_buffer_spinbo
         else:
             print(f"[VALIDATION] Post-trigger samples within device memory: {total_trigger_samples:,} / {cached_max_memory:,}")
     
+    _last_validation_key = cache_key
+    _last_validation_result = {
+        'new_buffer_size': new_buffer_size,
+        'new_pre_trigger_time': pre_trigger_time,
+        'new_max_pre_trigger': new_pre_trigger_samples,
+        'new_max_post_trigger': new_post_trigger_samples,
+    }
     return True, settings
 
 
@@ -376,7 +595,6 @@ def update_max_post_trigger_range(buffer_size, post_trigger_time_spinbox, hardwa
     # Calculate max time in seconds: (buffer_size - 1) / sample_rate
     max_time_seconds = (buffer_size - 1) / hardware_adc_sample_rate if hardware_adc_sample_rate > 0 else 1e6
     post_trigger_time_spinbox.setRange(0.0, max_time_seconds)
-    print(f"[OK] Updated max post trigger range: 100 to {max_allowed:,} samples")
 
 
 def apply_performance_settings(settings, timer):
@@ -404,7 +622,7 @@ def apply_performance_settings(settings, timer):
 
 
 def apply_time_window(settings, settings_changed, performance_changed, 
-                     data_lock, python_ring_buffer, data_array, x_data, 
+                     data_lock, python_ring_buffer, data_array,
                      ring_head, ring_filled, hardware_adc_sample_rate, 
                      plot, plot_signal, scope=None):
     """
@@ -417,7 +635,6 @@ def apply_time_window(settings, settings_changed, performance_changed,
         data_lock: Threading lock for data access
         python_ring_buffer: Current ring buffer size (will be updated)
         data_array: Ring buffer data array (will be updated)
-        x_data: X-axis data array (will be updated)
         ring_head: Ring buffer head position (will be updated)
         ring_filled: Ring buffer filled count (will be updated)
         hardware_adc_sample_rate: Hardware ADC sample rate
@@ -452,20 +669,28 @@ def apply_time_window(settings, settings_changed, performance_changed,
             # Pause briefly to avoid race condition
             with data_lock:
                 python_ring_buffer = new_ring_buffer
-                data_array = np.zeros(python_ring_buffer, dtype=np.float32)
-                x_data = np.arange(python_ring_buffer, dtype=np.float32)
+                data_array = _get_ring_buffer_arrays(python_ring_buffer)
                 ring_head = 0
                 ring_filled = 0
             print(f"[OK] Display window updated: {new_time_window:.1f}s ({python_ring_buffer:,} samples)")
-            # Update the plot x-range to match new time window
-            # This adjusts the number of samples across the graph based on ADC rate
-            # Y-axis remains fixed (ADC counts), selection window unaffected
-            plot.setXRange(0, new_time_window * hardware_adc_sample_rate, padding=0)
-            print(f"[SETTINGS] X-axis range updated: 0 to {new_time_window * hardware_adc_sample_rate:.0f} samples")
-            # Note: Y-axis limits are set once during initialization and don't need to be updated
-            # ADC limits are hardware-dependent and don't change during runtime
-            # Update display window label
-            plot_signal.buffer_status_updated.emit(0, python_ring_buffer)
+            # Suspend repaints of the widget hosting the plot so the x-range and
+            # status changes below are drawn in a single composite repaint
+            plot_view = plot.getViewWidget()
+            if plot_view is not None:
+                plot_view.setUpdatesEnabled(False)
+            try:
+                # Update the plot x-range to match new time window
+                # This adjusts the number of samples across the graph based on ADC rate
+                # Y-axis remains fixed (ADC counts), selection window unaffected
+                plot.setXRange(0, new_time_window * hardware_adc_sample_rate, padding=0)
+                print(f"[SETTINGS] X-axis range updated: 0 to {new_time_window * hardware_adc_sample_rate:.0f} samples")
+                # Note: Y-axis limits are set once during initialization and don't need to be updated
+                # ADC limits are hardware-dependent and don't change during runtime
+                # Update display window label
+                plot_signal.buffer_status_updated.emit(0, python_ring_buffer)
+            finally:
+                if plot_view is not None:
+                    plot_view.setUpdatesEnabled(True)  # Schedules the single repaint
         else:
             print(f"[OK] Time window setting updated (buffer size unchanged)")
         
@@ -475,14 +700,78 @@ def apply_time_window(settings, settings_changed, performance_changed,
     return False, new_ring_buffer
 
 
+@dataclass(frozen=True, slots=True)
+class RestartConfig:
+    "Restart values with new -> current -> default fallbacks resolved once"
+    trigger_enabled: bool
+    trigger_threshold: int
+    trigger_direction: object
+    channel_changed: bool
+    channel_range: object
+    channel_coupling: object
+    channel_probe_scale: float
+    previous_buffer_size: int
+    previous_mode: object
+    previous_ratio: int
+    previous_interval: object
+    previous_units: object
+    previous_max_pre_trigger: int
+    previous_max_post_trigger: int
+    previous_trigger_enabled: bool
+
+    @classmethod
+    def from_settings(cls, settings):
+        """
+        Resolve the restart configuration from validated settings.
+        
+        Args:
+            settings: Dictionary containing new and current settings
+        
+        Returns:
+            RestartConfig: Resolved restart configuration
+        """
+        get = settings.get
+        channel_range = get('new_channel_range')
+        channel_coupling = get('new_channel_coupling')
+        channel_probe_scale = get('new_channel_probe_scale')
+        return cls(
+            trigger_enabled=get('new_trigger_enabled', get('current_trigger_enabled', False)),
+            trigger_threshold=get('new_trigger_threshold', 0),
+            trigger_direction=get('new_trigger_direction'),
+            channel_changed=('new_channel_range' in settings or 'new_channel_coupling' in settings or
+                             'new_channel_probe_scale' in settings),
+            # Use current values from settings if new values not provided
+            channel_range=(channel_range if channel_range is not None
+                           else get('current_channel_range', psdk.RANGE.mV500)),
+            channel_coupling=(channel_coupling if channel_coupling is not None
+                              else get('current_channel_coupling', psdk.COUPLING.AC)),
+            channel_probe_scale=(channel_probe_scale if channel_probe_scale is not None
+                                 else get('current_channel_probe_scale', 1.0)),
+            previous_buffer_size=get('current_buffer_size', settings['new_buffer_size']),
+            previous_mode=get('current_mode', settings['new_mode']),
+            previous_ratio=get('current_ratio', settings['new_ratio']),
+            previous_interval=get('current_interval', settings['new_interval']),
+            previous_units=get('current_units', settings['new_units']),
+            previous_max_pre_trigger=get('current_max_pre_trigger', settings['new_max_pre_trigger']),
+            previous_max_post_trigger=get('current_max_post_trigger', settings['new_max_post_trigger']),
+            previous_trigger_enabled=get('current_trigger_enabled', get('new_trigger_enabled', False)),
+        )
+
+
 def apply_streaming_restart(settings, scope, buffer_0, buffer_1, data_lock, 
-                           python_ring_buffer, data_array, x_data, ring_head, ring_filled,
+                           python_ring_buffer, data_array, ring_head, ring_filled,
                            hardware_adc_sample_rate, settings_update_event, 
                            efficiency_history, perf_samples_window,
-                           status_displays, plot_signal, mode_combo, cached_max_memory, plot=None):
+                           status_displays, plot_signal, mode_combo, cached_max_memory, plot=None,
+                           *, on_complete):
     """
     Stop, reconfigure, and restart hardware streaming with new settings.
     
+    The hardware is stopped immediately. The rest of the restart runs from a single-shot
+    timer once STREAMING_STOP_DELAY_SEC has elapsed, so the Qt event loop keeps running
+    without re-entering this function; the caller must hold off other scope access until
+    on_complete has been called.
+    
     Args:
         settings: Dictionary containing new settings
         scope: PicoScope device instance
@@ -491,7 +780,6 @@ def apply_streaming_restart(settings, scope, buffer_0, buffer_1, data_lock,
         data_lock: Threading lock for data access
         python_ring_buffer: Ring buffer size (will be updated)
         data_array: Ring buffer data array (will be updated)
-        x_data: X-axis data array (will be updated)
         ring_head: Ring buffer head position (will be updated)
         ring_filled: Ring buffer filled count (will be updated)
         hardware_adc_sample_rate: Hardware ADC sample rate (will be updated)
@@ -502,11 +790,10 @@ def apply_streaming_restart(settings, scope, buffer_0, buffer_1, data_lock,
         plot_signal: Signal object for thread-safe communication
         mode_combo: Mode combobox for display text
         cached_max_memory: Cached maximum memory
-    
-    Returns:
-        tuple: (success, new_hardware_adc_sample_rate, new_ring_buffer_size, 
-                new_data_array, new_x_data, new_ring_head, new_ring_filled,
-                new_buffer_0, new_buffer_1)
+        plot: Plot widget for Y-axis updates (optional)
+        on_complete: Called with the result tuple (success, new_hardware_adc_sample_rate,
+            new_ring_buffer_size, new_data_array, new_ring_head, new_ring_filled,
+            new_buffer_0, new_buffer_1) when the restart has finished
     """
     new_ratio = settings['new_ratio']
     new_mode = settings['new_mode']
@@ -516,6 +803,8 @@ def apply_streaming_restart(settings, scope, buffer_0, buffer_1, data_lock,
     new_time_window = settings['new_time_window']
     new_max_pre_trigger = settings['new_max_pre_trigger']
     new_max_post_trigger = settings['new_max_post_trigger']
+    # Trigger, channel and previous (error recovery) values, resolved once
+    cfg = RestartConfig.from_settings(settings)
     
     # Calculate ring buffer requirements
     expected_adc_rate = calculate_sample_rate(new_interval, new_units)
@@ -526,240 +815,263 @@ def apply_streaming_restart(settings, scope, buffer_0, buffer_1, data_lock,
     # This prevents tiny buffers while allowing high ratios to work correctly
     new_ring_buffer = max(MIN_RING_BUFFER_SAMPLES, calculated_buffer)
     
-    # Check if hardware buffer size changed
-    old_buffer_size = settings.get('current_buffer_size', new_buffer_size)
-    buffer_size_changed = (new_buffer_size != old_buffer_size)
-    
-    # Check if mode changed (may require different datatype)
-    current_mode = settings.get('current_mode', new_mode)
-    mode_changed = (new_mode != current_mode)
+    # ADC datatypes for the new and previous modes (AVERAGE requires INT16_T, DECIMATE can use INT8_T)
+    adc_data_type, _ = get_datatype_for_mode(new_mode)
+    current_datatype, _ = get_datatype_for_mode(cfg.previous_mode)
     
     # Note: settings_update_in_progress flag is set by caller before this function
-    print("Starting streaming restart...")
+    _console_log("Starting streaming restart...")
     
+    # Stop streaming now; a failure is raised in complete_restart() so the usual
+    # recovery path restores the previous settings
+    _console_log("Stopping current streaming...")
     try:
-        # Stop streaming
-        print("Stopping current streaming...")
         stop_hardware_streaming(scope)
-        time.sleep(0.5)
-        
-        # Clear all buffers
-        print("Clearing buffers...")
-        clear_hardware_buffers(scope)
-        
-        # Update global variables (these would be passed back to main)
-        updated_settings = {
-            'DOWNSAMPLING_RATIO': new_ratio,
-            'DOWNSAMPLING_MODE': new_mode,
-            'sample_interval': new_interval,
-            'time_units': new_units,
-            'SAMPLES_PER_BUFFER': new_buffer_size,
-            'TARGET_TIME_WINDOW': new_time_window,
-            'MAX_PRE_TRIGGER_SAMPLES': new_max_pre_trigger,
-            'MAX_POST_TRIGGER_SAMPLES': new_max_post_trigger,
-            'hardware_adc_sample_rate': expected_adc_rate
-        }
-        
-        print(f"[OK] Updated hardware ADC rate: {expected_adc_rate:.2f} Hz")
-        print(f"[OK] Updated trigger samples: pre={new_max_pre_trigger:,}, post={new_max_post_trigger:,}")
-        
-        # Clear efficiency history since calculation basis changed
-        efficiency_history.clear()
-        perf_samples_window.clear()  # Clear performance window too!
-        print("[OK] Cleared efficiency and performance tracking for recalculation")
-        
-        # Reallocate hardware buffers if size changed OR mode changed (mode may require different datatype)
-        # Note: These are returned as part of the return tuple, caller must update globals
+        stop_error = None
+    except Exception as e:
+        stop_error = e
+    
+    def complete_restart():
+        """Reconfigure and restart streaming once the stop delay has elapsed."""
+        nonlocal python_ring_buffer, data_array, ring_head, ring_filled
+        # Note: These are returned as part of the result tuple, caller must update globals
         new_buffer_0 = buffer_0
         new_buffer_1 = buffer_1
-        if buffer_size_changed or mode_changed:
-            # Get correct datatype for the new mode (AVERAGE requires INT16_T, DECIMATE can use INT8_T)
-            _, numpy_dtype = get_datatype_for_mode(new_mode)
-            new_buffer_0 = np.zeros(new_buffer_size, dtype=numpy_dtype)
-            new_buffer_1 = np.zeros(new_buffer_size, dtype=numpy_dtype)
-            dtype_name = "INT16" if numpy_dtype == np.int16 else "INT8"
-            print(f"[OK] Hardware buffers reallocated: {new_buffer_size:,} samples (dtype: {dtype_name})")
-        
-        # Reallocate ring buffer if size changed OR if settings changed (to clear old data)
-        # Always reset ring buffer when restarting to ensure clean state with new settings
-        python_ring_buffer = new_ring_buffer
-        data_array = np.zeros(python_ring_buffer, dtype=np.float32)
-        x_data = np.arange(python_ring_buffer, dtype=np.float32)
-        ring_head = 0
-        ring_filled = 0  # CRITICAL: Reset to 0 to clear all old data when settings change
-        print(f"[OK] Ring buffer reset and reallocated: {python_ring_buffer:,} samples (time window: {new_time_window:.1f}s)")
-        print(f"[OK] All old data cleared - ring_filled reset to 0 for fresh start with new settings")
-        
-        # Apply channel settings if changed (requires restart due to hardware limitations)
-        if 'new_channel_range' in settings or 'new_channel_coupling' in settings or 'new_channel_probe_scale' in settings:
-            channel_range = settings.get('new_channel_range')
-            channel_coupling = settings.get('new_channel_coupling')
-            channel_probe_scale = settings.get('new_channel_probe_scale')
-            # Use current values from settings if new values not provided
-            if channel_range is None:
-                channel_range = settings.get('current_channel_range', psdk.RANGE.mV500)
-            if channel_coupling is None:
-                channel_coupling = settings.get('current_channel_coupling', psdk.COUPLING.AC)
-            if channel_probe_scale is None:
-                channel_probe_scale = settings.get('current_channel_probe_scale', 1.0)
+        try:
+            if stop_error is not None:
+                raise stop_error
+                
+            # Reallocate hardware buffers only if the size or the datatype for the mode changed
+            # (AVERAGE requires INT16_T, DECIMATE can use INT8_T); otherwise the driver reuses them
+            numpy_dtype = _MODE_NUMPY_DTYPE.get(new_mode, np.int8)
+            reallocate_hw_buffers = (buffer_0 is None or len(buffer_0) != new_buffer_size or
+                                     buffer_0.dtype != numpy_dtype)
             
-            print(f"[CHANNEL] Applying channel settings during restart: range={channel_range}, coupling={channel_coupling}, probe_scale={channel_probe_scale}")
-            scope.set_channel(
-                channel=psdk.CHANNEL.A,
-                range=channel_range,
-                coupling=channel_coupling,
-                probe_scale=channel_probe_scale
-            )
-            print("[CHANNEL] Channel settings applied successfully")
-        
-        # Re-register buffers with new settings
-        # Get correct datatype for the mode (AVERAGE requires INT16_T, DECIMATE can use INT8_T)
-        adc_data_type, _ = get_datatype_for_mode(new_mode)
-        dtype_name = "INT16_T" if adc_data_type == psdk.DATA_TYPE.INT16_T else "INT8_T"
-        
-        # Check if datatype changed (which would mean ADC limits changed)
-        current_datatype, _ = get_datatype_for_mode(current_mode)
-        datatype_changed = (adc_data_type != current_datatype)
-        
-        # Update ADC limits and Y-axis if datatype changed (ADC limits are datatype-dependent)
-        if datatype_changed:
-            # Update scope's ADC limits for the new datatype (updates internal state)
-            print(f"[ADC LIMITS] Datatype changed: updating ADC limits for {dtype_name}")
-            min_adc, max_adc = scope.get_adc_limits(datatype=adc_data_type)
-            print(f"[ADC LIMITS] Hardware returned ADC limits: {min_adc} to {max_adc} (datatype: {dtype_name})")
+            # Existing registrations are cleared by register_double_buffers (CLEAR_ALL | ADD)
+            if reallocate_hw_buffers:
+                # Uninitialised is fine: the driver writes each region before the streaming
+                # thread reads it, so zeroing would only add an O(N) memset per buffer
+                new_buffer_0 = np.empty(new_buffer_size, dtype=numpy_dtype)
+                new_buffer_1 = np.empty(new_buffer_size, dtype=numpy_dtype)
             
-            # Update plot Y-axis to match new ADC limits (only if plot is provided)
-            # Use QTimer to defer the update slightly to ensure it happens after all operations
-            if plot is not None:
-                if QT_AVAILABLE:
-                    # Defer the Y-axis update to ensure it happens after streaming restart
-                    QtCore.QTimer.singleShot(100, lambda: data_processing.update_y_axis_from_adc_limits(plot, scope, datatype=adc_data_type))
-                else:
-                    # Fallback if Qt is not available (shouldn't happen, but just in case)
-                    data_processing.update_y_axis_from_adc_limits(plot, scope, datatype=adc_data_type)
-                print(f"[ADC LIMITS] Plot Y-axis update scheduled for {dtype_name} datatype")
+            # Update global variables (these would be passed back to main)
+            updated_settings = {
+                'DOWNSAMPLING_RATIO': new_ratio,
+                'DOWNSAMPLING_MODE': new_mode,
+                'sample_interval': new_interval,
+                'time_units': new_units,
+                'SAMPLES_PER_BUFFER': new_buffer_size,
+                'TARGET_TIME_WINDOW': new_time_window,
+                'MAX_PRE_TRIGGER_SAMPLES': new_max_pre_trigger,
+                'MAX_POST_TRIGGER_SAMPLES': new_max_post_trigger,
+                'hardware_adc_sample_rate': expected_adc_rate
+            }
+            
+            _console_log("[OK] Updated hardware ADC rate: {:.2f} Hz", expected_adc_rate)
+            _console_log("[OK] Updated trigger samples: pre={:,}, post={:,}", new_max_pre_trigger, new_max_post_trigger)
+            
+            # Clear efficiency history since calculation basis changed
+            efficiency_history.clear()
+            perf_samples_window.clear()  # Clear performance window too!
+            _console_log("[OK] Cleared efficiency and performance tracking for recalculation")
+            
+            if reallocate_hw_buffers:
+                _console_log("[OK] Hardware buffers reallocated: {:,} samples (dtype: {})",
+                             new_buffer_size, DATA_TYPE_NAMES[adc_data_type])
             else:
-                print(f"[WARNING] Plot not provided - Y-axis not updated (datatype: {dtype_name})")
-        
-        print(f"Re-registering buffers with ratio={new_ratio}, mode={new_mode}, datatype={dtype_name}")
-        register_double_buffers(scope, new_buffer_0, new_buffer_1, new_buffer_size, 
-                               adc_data_type, new_mode)
-        
-        # Apply trigger configuration before restarting streaming
-        # Determine if we're in INT8 mode for proper trigger threshold scaling
-        is_int8_mode = (adc_data_type == psdk.DATA_TYPE.INT8_T)
-        trigger_enabled = settings.get('new_trigger_enabled', settings.get('current_trigger_enabled', False))
-        trigger_threshold = settings.get('new_trigger_threshold', 0)
-        apply_trigger_configuration(scope, trigger_enabled, trigger_threshold, settings.get('new_trigger_direction'), is_int8_mode)
-        
-        # Short delay after all buffer operations and before restarting streaming
-        # This ensures clean state transition and proper hardware synchronization
-        time.sleep(0.9)  # 100ms delay for optimal state transition
-        
-        # Restart streaming with new parameters
-        actual_interval, new_rate = start_streaming(
-            scope=scope,
-            sample_interval=new_interval,
-            time_units=new_units,
-            max_pre_trigger=new_max_pre_trigger,
-            max_post_trigger=new_max_post_trigger,
-            trigger_enabled=trigger_enabled,
-            ratio=new_ratio,
-            ratio_mode=new_mode
-        )
-        
-        print(f"[OK] Streaming restarted successfully")
-        print(f"  New ratio: {new_ratio}:1")
-        print(f"  New mode: {mode_combo.currentText()}")
-        print(f"  Actual interval: {actual_interval} {new_units}")
-        
-        # Verify the actual rate matches what we calculated during validation
-        # (should be very close since we used get_nearest_sampling_interval)
-        print(f"  Hardware ADC rate: {new_rate:.2f} Hz (actual from device)")
-        print(f"  Pre-trigger samples: {new_max_pre_trigger:,} (calculated using device actual rate)")
-        print(f"  Post-trigger samples: {new_max_post_trigger:,} (calculated using device actual rate)")
-        
-        # Update global hardware ADC sample rate
-        updated_settings['hardware_adc_sample_rate'] = new_rate
-        
-        downsampled_rate = new_rate / new_ratio
-        print(f"  Downsampled rate: {downsampled_rate:.2f} Hz")
-        
-        # Update rate displays
-        adc_msps = new_rate / 1_000_000
-        downsampled_msps = adc_msps / new_ratio
-        downsampled_khz = downsampled_msps * 1000  # Convert MSPS to kHz
-        status_displays['adc_rate'].setText(f"{adc_msps:.3f} MSPS")
-        status_displays['downsampled_rate'].setText(f"{downsampled_khz:.3f} kHz")
-        
-        # Update min poll interval display
-        try:
-            down_rate_hz = new_rate / new_ratio
-            if down_rate_hz > 0:
-                min_poll_seconds = new_buffer_size / down_rate_hz
-                min_poll_ms = min_poll_seconds * 1000.0
-                status_displays['min_poll'].setText(f"{min_poll_ms:.2f} ms")
-        except Exception:
-            pass
-        
-        # Update memory requirement display
-        memory_required = new_buffer_size * new_ratio
-        status_displays['memory_req'].setText(f"{memory_required:,} samples")
-        
-        # Update display window
-        status_displays['display_window'].setText(f'0.0 s (0 / {python_ring_buffer:,})')
-        
-        plot_signal.title_updated.emit(
-            f"Real-time Streaming Data - {new_ratio}:1 {mode_combo.currentText()}"
-        )
-        
-        # Note: Y-axis limits are set once during initialization and don't need to be updated
-        # ADC limits are hardware-dependent and don't change during runtime
-        
-        return True, new_rate, new_ring_buffer, data_array, x_data, ring_head, ring_filled, new_buffer_0, new_buffer_1
-        
-    except Exception as e:
-        print(f"[WARNING] Error updating settings: {e}")
-        print(f"  Attempting to restore previous settings...")
-        # Try to restore previous settings
-        try:
-            stop_hardware_streaming(scope)
-            time.sleep(0.5)
-            clear_hardware_buffers(scope)
-            # Get correct datatype for the previous mode being restored
-            restore_mode = settings.get('current_mode', new_mode)
-            restore_datatype, _ = get_datatype_for_mode(restore_mode)
-            register_double_buffers(scope, new_buffer_0, new_buffer_1, old_buffer_size, 
-                                   restore_datatype, restore_mode)
-            # Use current trigger state for error recovery
-            recovery_trigger_enabled = settings.get('current_trigger_enabled', settings.get('new_trigger_enabled', False))
-            _, _ = start_streaming(
+                _console_log("[OK] Hardware buffers reused: {:,} samples (size and dtype unchanged)", new_buffer_size)
+            
+            # Reallocate ring buffer if size changed OR if settings changed (to clear old data)
+            # Always reset ring buffer when restarting to ensure clean state with new settings
+            python_ring_buffer = new_ring_buffer
+            # Size unchanged (e.g. only interval/trigger changed): keep the array, resetting
+            # ring_filled below invalidates the old samples
+            if not (new_ring_buffer == old_ring_buffer and data_array is not None and
+                    len(data_array) == new_ring_buffer):
+                data_array = _get_ring_buffer_arrays(python_ring_buffer)
+            ring_head = 0
+            ring_filled = 0  # CRITICAL: Reset to 0 to clear all old data when settings change
+            _console_log("[OK] Ring buffer reset and reallocated: {:,} samples (time window: {:.1f}s)",
+                         python_ring_buffer, new_time_window)
+            _console_log("[OK] All old data cleared - ring_filled reset to 0 for fresh start with new settings")
+            
+            # Apply channel settings if changed (requires restart due to hardware limitations)
+            if cfg.channel_changed:
+                _console_log("[CHANNEL] Applying channel settings during restart: range={}, coupling={}, probe_scale={}",
+                             cfg.channel_range, cfg.channel_coupling, cfg.channel_probe_scale)
+                scope.set_channel(
+                    channel=psdk.CHANNEL.A,
+                    range=cfg.channel_range,
+                    coupling=cfg.channel_coupling,
+                    probe_scale=cfg.channel_probe_scale
+                )
+                _console_log("[CHANNEL] Channel settings applied successfully")
+            
+            # Re-register buffers with new settings
+            dtype_name = DATA_TYPE_NAMES[adc_data_type]
+            
+            # Check if datatype changed (which would mean ADC limits changed)
+            datatype_changed = (adc_data_type != current_datatype)
+            
+            # Update ADC limits and Y-axis if datatype changed (ADC limits are datatype-dependent)
+            if datatype_changed:
+                # Update scope's ADC limits for the new datatype (updates internal state)
+                _console_log("[ADC LIMITS] Datatype changed: updating ADC limits for {}", dtype_name)
+                min_adc, max_adc = scope.get_adc_limits(datatype=adc_data_type)
+                _console_log("[ADC LIMITS] Hardware returned ADC limits: {} to {} (datatype: {})", min_adc, max_adc, dtype_name)
+                
+                # Update plot Y-axis to match new ADC limits (only if plot is provided)
+                if plot is not None:
+                    if QT_AVAILABLE:
+                        # Queued signal: the Y-axis update runs once the event loop resumes after the restart
+                        plot_signal.adc_limits_changed.emit(int(adc_data_type))
+                    else:
+                        # Fallback if Qt is not available (shouldn't happen, but just in case)
+                        data_processing.update_y_axis_from_adc_limits(plot, scope, datatype=adc_data_type)
+                    _console_log("[ADC LIMITS] Plot Y-axis update scheduled for {} datatype", dtype_name)
+                else:
+                    _console_log("[WARNING] Plot not provided - Y-axis not updated (datatype: {})", dtype_name)
+            
+            _console_log("Re-registering buffers with ratio={}, mode={}, datatype={}", new_ratio, new_mode, dtype_name)
+            register_double_buffers(scope, new_buffer_0, new_buffer_1, new_buffer_size, 
+                                   adc_data_type, new_mode)
+            
+            # Apply trigger configuration before restarting streaming
+            # Determine if we're in INT8 mode for proper trigger threshold scaling
+            is_int8_mode = (adc_data_type == psdk.DATA_TYPE.INT8_T)
+            apply_trigger_configuration(scope, cfg.trigger_enabled, cfg.trigger_threshold, cfg.trigger_direction, is_int8_mode)
+            
+            # Wait for the device to respond after all buffer operations and before restarting
+            # streaming, so the restart proceeds as soon as the hardware is ready
+            wait_hardware_ready(scope)
+            
+            # Restart streaming with new parameters
+            actual_interval, new_rate = start_streaming(
                 scope=scope,
-                sample_interval=settings.get('current_interval', new_interval),
-                time_units=settings.get('current_units', new_units),
-                max_pre_trigger=settings.get('current_max_pre_trigger', new_max_pre_trigger),
-                max_post_trigger=settings.get('current_max_post_trigger', new_max_post_trigger),
-                trigger_enabled=recovery_trigger_enabled,
-                ratio=settings.get('current_ratio', new_ratio),
-                ratio_mode=settings.get('current_mode', new_mode)
+                sample_interval=new_interval,
+                time_units=new_units,
+                max_pre_trigger=new_max_pre_trigger,
+                max_post_trigger=new_max_post_trigger,
+                trigger_enabled=cfg.trigger_enabled,
+                ratio=new_ratio,
+                ratio_mode=new_mode
             )
-            print("[OK] Restored to previous settings")
-        except Exception as restore_error:
-            print(f"[WARNING] Failed to restore settings: {restore_error}")
-        
-        plot_signal.title_updated.emit("Error updating settings - check console")
-        return False, None, None, None, None, None, None, None, None
+            
+            _console_log("[OK] Streaming restarted successfully")
+            # Detailed restart diagnostics are compiled out under python -O
+            if __debug__:
+                _console_log("  New ratio: {}:1", new_ratio)
+                _console_log("  New mode: {}", mode_combo.currentText())
+                _console_log("  Actual interval: {} {}", actual_interval, new_units)
+                
+                # Verify the actual rate matches what we calculated during validation
+                # (should be very close since we used get_nearest_sampling_interval)
+                _console_log("  Hardware ADC rate: {:.2f} Hz (actual from device)", new_rate)
+                _console_log("  Pre-trigger samples: {:,} (calculated using device actual rate)", new_max_pre_trigger)
+                _console_log("  Post-trigger samples: {:,} (calculated using device actual rate)", new_max_post_trigger)
+            
+            # Update global hardware ADC sample rate
+            updated_settings['hardware_adc_sample_rate'] = new_rate
+            
+            if __debug__:
+                _console_log("  Downsampled rate: {:.2f} Hz", new_rate / new_ratio)
+            
+            # Update rate displays
+            adc_msps = new_rate / 1_000_000
+            downsampled_msps = adc_msps / new_ratio
+            downsampled_khz = downsampled_msps * 1000  # Convert MSPS to kHz
+            memory_required = new_buffer_size * new_ratio
+            
+            # Batch all status label updates into a single repaint of the status bar
+            status_bar = status_displays['adc_rate'].parentWidget()
+            if status_bar is not None:
+                status_bar.setUpdatesEnabled(False)
+            try:
+                status_displays['adc_rate'].setText(f"{adc_msps:.3f} MSPS")
+                status_displays['downsampled_rate'].setText(f"{downsampled_khz:.3f} kHz")
+                
+                # Update min poll interval display
+                try:
+                    down_rate_hz = new_rate / new_ratio
+                    if down_rate_hz > 0:
+                        min_poll_seconds = new_buffer_size / down_rate_hz
+                        min_poll_ms = min_poll_seconds * 1000.0
+                        status_displays['min_poll'].setText(f"{min_poll_ms:.2f} ms")
+                except Exception:
+                    pass
+                
+                # Update memory requirement display
+                status_displays['memory_req'].setText(f"{memory_required:,} samples")
+                
+                # Update display window
+                status_displays['display_window'].setText(f'0.0 s (0 / {python_ring_buffer:,})')
+            finally:
+                if status_bar is not None:
+                    status_bar.setUpdatesEnabled(True)
+                    status_bar.update()
+            
+            plot_signal.title_updated.emit(
+                f"Real-time Streaming Data - {new_ratio}:1 {mode_combo.currentText()}"
+            )
+            
+            # Note: Y-axis limits are set once during initialization and don't need to be updated
+            # ADC limits are hardware-dependent and don't change during runtime
+            
+            return True, new_rate, new_ring_buffer, data_array, ring_head, ring_filled, new_buffer_0, new_buffer_1
+            
+        except Exception as e:
+            _console_log("[WARNING] Error updating settings: {}", e)
+            _console_log("  Attempting to restore previous settings...")
+            # Try to restore previous settings
+            try:
+                stop_hardware_streaming(scope)
+                # Rare recovery path: a plain blocking wait keeps it strictly sequential
+                time.sleep(STREAMING_STOP_DELAY_SEC)
+                # Restore the previous mode with its datatype (clears the failed registration too).
+                # Register the original buffers: they match the previous size and dtype, and the
+                # caller keeps them as its globals because the failure result returns no buffers
+                register_double_buffers(scope, buffer_0, buffer_1, cfg.previous_buffer_size, 
+                                       current_datatype, cfg.previous_mode)
+                # Use current trigger state for error recovery
+                _, _ = start_streaming(
+                    scope=scope,
+                    sample_interval=cfg.previous_interval,
+                    time_units=cfg.previous_units,
+                    max_pre_trigger=cfg.previous_max_pre_trigger,
+                    max_post_trigger=cfg.previous_max_post_trigger,
+                    trigger_enabled=cfg.previous_trigger_enabled,
+                    ratio=cfg.previous_ratio,
+                    ratio_mode=cfg.previous_mode
+                )
+                _console_log("[OK] Restored to previous settings")
+            except Exception as restore_error:
+                _console_log("[WARNING] Failed to restore settings: {}", restore_error)
+            
+            plot_signal.title_updated.emit("Error updating settings - check console")
+            return False, None, None, None, None, None, None, None
     
-    finally:
-        # Signal streaming thread to resume (caller will handle this, but set event here too)
-        settings_update_event.set()
-        print("Streaming restart complete")
+        finally:
+            # Signal streaming thread to resume (caller will handle this, but set event here too)
+            settings_update_event.set()
+            _console_log("Streaming restart complete")
+    
+    # Finish from a single-shot timer rather than a nested event loop, so the restart's
+    # hardware sequence is never interleaved with other handlers that touch the scope
+    _run_after_delay(STREAMING_STOP_DELAY_SEC, lambda: on_complete(complete_restart()))
 
 
 # ============================================================================
 # UI STATUS DISPLAY UPDATE FUNCTIONS
 # ============================================================================
 
+# Display window time formats: (threshold_seconds, multiplier, format), largest unit first
+_DISPLAY_TIME_FORMATS = (
+    (60.0, 1 / 60.0, "{:.1f} min"),
+    (1.0, 1.0, "{:.1f} s"),
+)
+_DISPLAY_TIME_FALLBACK_FORMAT = (1000.0, "{:.1f} ms")  # Below one second
+
+
 def update_buffer_status(current, total, downsampling_ratio, hardware_adc_sample_rate, status_displays):
     """
     Update the display window time and sample count in top bar.
@@ -775,67 +1087,31 @@ def update_buffer_status(current, total, downsampling_ratio, hardware_adc_sample
     original_samples = current * downsampling_ratio
     time_seconds = original_samples / hardware_adc_sample_rate if hardware_adc_sample_rate > 0 else 0
     
-    # Format time in appropriate units
-    if time_seconds >= 60:
-        time_str = f"{time_seconds/60:.1f} min"
-    elif time_seconds >= 1:
-        time_str = f"{time_seconds:.1f} s"
+    # Format time in the first unit whose threshold it reaches
+    for threshold, multiplier, time_fmt in _DISPLAY_TIME_FORMATS:
+        if time_seconds >= threshold:
+            break
     else:
-        time_str = f"{time_seconds*1000:.1f} ms"
+        multiplier, time_fmt = _DISPLAY_TIME_FALLBACK_FORMAT
+    time_str = time_fmt.format(time_seconds * multiplier)
     
-    status_displays['display_window'].setText(f'{time_str} ({current:,} / {total:,})')
+    # Skip the repaint if the label text is unchanged
+    text = f'{time_str} ({current:,} / {total:,})'
+    label = status_displays['display_window']
+    if label.text() != text:
+        label.setText(text)
 
 
-def update_efficiency_display(efficiency, jitter, status, status_displays):
-    """
-    Update the efficiency display with color coding based on both efficiency and jitter.
-    
-    Args:
-        efficiency: Average efficiency percentage
-        jitter: Standard deviation of efficiency (consistency metric)
-        status: Overall status ('excellent', 'good', 'warning', 'critical', 'initializing')
-        status_displays: Dictionary of status display widgets
-    """
-    # Choose color based on status
-    if status == "excellent":
-        color = "#90EE90"  # Light green
-        bg_color = "#2d4a2d"
-        border_color = "#4a6b4a"
-        status_icon = "[ACTIVE]"  # Solid circle
-        status_text = "Excellent"
-    elif status == "good":
-        color = "#90EE90"  # Light green
-        bg_color = "#2d4a2d"
-        border_color = "#4a6b4a"
-        status_icon = "[ACTIVE]"
-        status_text = "Good"
-    elif status == "warning":
-        color = "#FFD700"  # Gold/Yellow
-        bg_color = "#4a4a2d"
-        border_color = "#6b6b4a"
-        status_icon = "◐"  # Half-filled circle
-        status_text = "Warning"
-    elif status == "critical":
-        color = "#FF6B6B"  # Light red
-        bg_color = "#4a2d2d"
-        border_color = "#6b4a4a"
-        status_icon = "[DISABLED]"  # Empty circle
-        status_text = "Critical"
-    else:  # initializing
-        color = "#CCCCCC"  # Gray
-        bg_color = "#3a3a3a"
-        border_color = "#555555"
-        status_icon = "◌"
-        status_text = "Starting..."
-    
-    # Format display text with efficiency and jitter
-    if jitter > 0:
-        display_text = f"{status_icon} {efficiency:.1f}% (±{jitter:.1f}%)"
-    else:
-        display_text = f"{status_icon} {efficiency:.1f}%"
-    
-    status_displays['efficiency'].setText(display_text)
-    status_displays['efficiency'].setStyleSheet(f"""
+# Efficiency display appearance per status: (text color, background, border, icon, label)
+_EFFICIENCY_STATUS_STYLES = {
+    'excellent': ("#90EE90", "#2d4a2d", "#4a6b4a", "[ACTIVE]", "Excellent"),  # Light green, solid circle
+    'good': ("#90EE90", "#2d4a2d", "#4a6b4a", "[ACTIVE]", "Good"),  # Light green
+    'warning': ("#FFD700", "#4a4a2d", "#6b6b4a", "◐", "Warning"),  # Gold/Yellow, half-filled circle
+    'critical': ("#FF6B6B", "#4a2d2d", "#6b4a4a", "[DISABLED]", "Critical"),  # Light red, empty circle
+    'initializing': ("#CCCCCC", "#3a3a3a", "#555555", "◌", "Starting..."),  # Gray
+}
+
+_EFFICIENCY_STYLESHEET = """
         QLabel {{
             background-color: {bg_color};
             color: {color};
@@ -845,14 +1121,14 @@ def update_efficiency_display(efficiency, jitter, status, status_displays):
             font-weight: bold;
             border-radius: 3px;
         }}
-    """)
-    
-    # Update tooltip with detailed information - styled for readability
-    tooltip_text = f"""
+    """
+
+# Tooltip styled for readability; {{efficiency}} and {{jitter}} survive the per-status format
+_EFFICIENCY_TOOLTIP = """
     <div style='background-color: #2b2b2b; color: #ffffff; padding: 8px; border: 1px solid #555555;'>
         <p style='margin: 2px; color: {color};'><b>System Performance: {status_text}</b></p>
-        <p style='margin: 2px; color: #ffffff;'>Average Efficiency: <b>{efficiency:.2f}%</b></p>
-        <p style='margin: 2px; color: #ffffff;'>Consistency (Jitter): <b>±{jitter:.2f}%</b></p>
+        <p style='margin: 2px; color: #ffffff;'>Average Efficiency: <b>{{efficiency:.2f}}%</b></p>
+        <p style='margin: 2px; color: #ffffff;'>Consistency (Jitter): <b>±{{jitter:.2f}}%</b></p>
         <hr style='border: 0; border-top: 1px solid #555555; margin: 6px 0;'>
         <p style='margin: 2px; color: #cccccc;'><b>Status Levels:</b></p>
         <p style='margin: 2px; color: #90EE90;'>[ACTIVE] <b>Excellent:</b> Avg≥95%, Jitter&lt;5%</p>
@@ -861,6 +1137,50 @@ def update_efficiency_display(efficiency, jitter, status, status_displays):
         <p style='margin: 2px; color: #FF6B6B;'>[DISABLED] <b>Critical:</b> System falling behind</p>
     </div>
     """
-    status_displays['efficiency'].setToolTip(tooltip_text)
 
+# Per status: (icon, stylesheet, tooltip template), built once
+_EFFICIENCY_DISPLAY = {
+    status: (icon,
+             _EFFICIENCY_STYLESHEET.format(bg_color=bg_color, color=color, border_color=border_color),
+             _EFFICIENCY_TOOLTIP.format(color=color, status_text=status_text))
+    for status, (color, bg_color, border_color, icon, status_text) in _EFFICIENCY_STATUS_STYLES.items()
+}
+
+# Status whose stylesheet is currently applied to the efficiency label
+_last_efficiency_status = None
 
+
+def update_efficiency_display(efficiency, jitter, status, status_displays):
+    """
+    Update the efficiency display with color coding based on both efficiency and jitter.
+    
+    The stylesheet is only reapplied when the status changes, since each setStyleSheet()
+    call makes Qt recompute the label style.
+    
+    Args:
+        efficiency: Average efficiency percentage
+        jitter: Standard deviation of efficiency (consistency metric)
+        status: Overall status ('excellent', 'good', 'warning', 'critical', 'initializing')
+        status_displays: Dictionary of status display widgets
+    """
+    global _last_efficiency_status
+    
+    # Unknown statuses are shown as initializing
+    if status not in _EFFICIENCY_DISPLAY:
+        status = 'initializing'
+    status_icon, stylesheet, tooltip_template = _EFFICIENCY_DISPLAY[status]
+    label = status_displays['efficiency']
+    
+    # Format display text with efficiency and jitter
+    if jitter > 0:
+        display_text = f"{status_icon} {efficiency:.1f}% (±{jitter:.1f}%)"
+    else:
+        display_text = f"{status_icon} {efficiency:.1f}%"
+    
+    label.setText(display_text)
+    if status != _last_efficiency_status:
+        label.setStyleSheet(stylesheet)
+        _last_efficiency_status = status
+    
+    # Update tooltip with detailed information
+    label.setToolTip(tooltip_template.format(efficiency=efficiency, jitter=jitter))
@@ -16,6 +16,7 @@ class ChannelClass:
     range: cst.RANGE
     range_mv: int
     probe_scale: float
+    scaled_range_mv: float
     ylim_mv: int
     ylim_v: float
 
@@ -24,6 +25,8 @@ class ChannelClass:
         self.probe_scale = probe_scale
         self.range_mv = cst.RANGE_LIST[ch_range]
         self.range_v = self.range_mv / 1000
+        # Full-scale input at the probe tip, precomputed for ADC conversions
+        self.scaled_range_mv = self.range_mv * probe_scale
         self.ylim_mv = np.array([-self.range_mv, self.range_mv]) * probe_scale
         self.ylim_v = self.ylim_mv / 1000
 
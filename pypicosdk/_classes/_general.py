@@ -13,3 +13,4 @@ class BaseDataClass:
     last_pre_trig: float = 50
     last_datatype: cst.DATA_TYPE = cst.DATA_TYPE.INT16_T
     last_buffer_size: int = None
+    last_timebase_interval: tuple = None  # (timebase, resolution, interval_ns) of last GetTimebase
@@ -41,8 +41,7 @@ class ps5000a(PicoScopeBase, Sharedps5000aPs6000a):  # pylint: disable=C0103
         resolution: str | cst.resolution_literal | cst.RESOLUTION = cst.RESOLUTION.BIT_8
     ) -> None:
         resolution = _get_literal(resolution, cst.resolution_map)
-        if serial_number is not None:
-            serial_number = serial_number.encode()
+        serial_number = self._encode_serial(serial_number)
         status = self._call_attr_function(
             'OpenUnit',
             ctypes.byref(self.handle),
@@ -428,8 +427,6 @@ class ps5000a(PicoScopeBase, Sharedps5000aPs6000a):  # pylint: disable=C0103
         if sweep is False:
             stop_freq = frequency
 
-        if isinstance(buffer, list):
-            buffer = np.array(buffer)
         buffer_ptr, buffer_len = _siggen_get_buffer_args(buffer)
 
         self._call_attr_function(
@@ -550,7 +547,7 @@ class ps5000a(PicoScopeBase, Sharedps5000aPs6000a):  # pylint: disable=C0103
         self,
         timebase: int, ac_adaptor: bool | None = None,
         return_type: cst.ReturnTypeMap = 'string',
-    ) -> list[list[str] | list[int]]:
+    ) -> list[list[str] | list[int]] | np.ndarray:
         """
         Get the avaliable channel combinations at a given timebase for the ps5000a.
 
@@ -560,16 +557,18 @@ class ps5000a(PicoScopeBase, Sharedps5000aPs6000a):  # pylint: disable=C0103
             ac_adaptor: Whether to use the AC adaptor. Defaults to None, which will use the
                 ac_adaptor of the current device.
             return_type: Type of return value. Defaults to 'string'.
-                Can be 'string' or 'enum'.
+                Can be 'string', 'enum' or 'flags'.
                 If 'string', returns the channel combinations as a list of strings.
                 If 'enum', returns the channel combinations as a list of enums.
+                If 'flags', returns the raw uint32 ``PICO_CHANNEL_FLAGS`` masks as a
+                NumPy array without building any Python lists.
 
         Returns:
-            list[list[str] | list[int]]: List of channel combinations.
+            list[list[str] | list[int]] | np.ndarray: List of channel combinations.
                 Each list contains the channel combinations for a given timebase.
                 If return_type is 'string', the list contains the channel combinations as a list of
                 strings. If return_type is 'enum', the list contains the channel combinations as a
-                list of channel enum values.
+                list of channel enum values. If return_type is 'flags', a NumPy array of masks.
         """
         if ac_adaptor is None:
             ac_adaptor = self.ac_adaptor
@@ -585,26 +584,17 @@ class ps5000a(PicoScopeBase, Sharedps5000aPs6000a):  # pylint: disable=C0103
             ac_adaptor,
         )
 
-        combo_array = (ctypes.c_uint32 * n_combos.value)()
+        combo_array = np.empty(n_combos.value, dtype=np.uint32)
         self._call_attr_function(
             "ChannelCombinationsStateless",
             self.handle,
-            ctypes.byref(combo_array),
+            ctypes.c_void_p(combo_array.ctypes.data),
             ctypes.byref(n_combos),
             self.resolution,
             ctypes.c_uint32(timebase),
             ac_adaptor,
         )
-        combo_array = list(combo_array)
-        channel_combinations = []
-        for n, i in enumerate(combo_array):
-            channel_combinations.append([])
-            for j in cst.PICO_CHANNEL_FLAGS:
-                if i & j == j and return_type == 'string':
-                    channel_combinations[n].append(cst.PicoChannelFlagsMap[j])
-                elif i & j == j and return_type == 'enum':
-                    channel_combinations[n].append(cst.PicoChannelFlagsEnumMap[j])
-        return channel_combinations
+        return self._decode_channel_combinations(combo_array, return_type)
 
     def get_avaliable_channel_ranges(
         self,
@@ -2,6 +2,7 @@
 Copyright (C) 2025-2025 Pico Technology Ltd. See LICENSE file for terms.
 """
 import ctypes
+import operator
 import platform
 import os
 from typing import Any
@@ -52,7 +53,18 @@ def _check_path(location: str, folders: list) -> str:
     Returns:
         str: Full path of the first located folder
     """
+    # One directory read replaces a stat per candidate whose top folder is missing.
+    # normcase keeps the match case-insensitive on Windows
+    entries = set()
+    if location:
+        try:
+            with os.scandir(location) as scan:
+                entries = {os.path.normcase(entry.name) for entry in scan}
+        except OSError:
+            pass
     for folder in folders:
+        if os.path.normcase(folder.split(os.sep, 1)[0]) not in entries:
+            continue
         path = os.path.join(location, folder)
         if os.path.exists(path):
             return path
@@ -91,6 +103,10 @@ def _get_lib_path() -> str:
         raise PicoSDKException("Unsupported OS")
 
 
+# Per (struct type, format) dict keys and attribute getter used by _struct_to_dict
+_STRUCT_DICT_CACHE: dict[tuple[type, bool], tuple[tuple[str, ...], operator.attrgetter]] = {}
+
+
 def _struct_to_dict(
         struct_instance: ctypes.Structure,
         format=False  # pylint: disable=W0622
@@ -103,13 +119,26 @@ def _struct_to_dict(
     Returns:
         dict: python dictionary of struct values
     """
-    result = {}
-    for field_name, _ in struct_instance._fields_:  # pylint: disable=W0212
+    key = (type(struct_instance), format)
+    cached = _STRUCT_DICT_CACHE.get(key)
+    if cached is None:
+        field_names = [name for name, _ in struct_instance._fields_]  # pylint: disable=W0212
         if format:
-            result[field_name.replace('_', '')] = getattr(struct_instance, field_name)
+            keys = tuple(name.replace('_', '') for name in field_names)
         else:
-            result[field_name] = getattr(struct_instance, field_name)
-    return result
+            keys = tuple(field_names)
+        cached = _STRUCT_DICT_CACHE[key] = (keys, operator.attrgetter(*field_names))
+    keys, getter = cached
+    values = getter(struct_instance)
+    if len(keys) == 1:
+        # attrgetter with a single name returns the value rather than a tuple
+        values = (values,)
+    return dict(zip(keys, values))
+
+
+# Resolved (id(map_dict), literal) -> (map_dict, value) lookups used by _get_literal
+_LITERAL_CACHE: dict[tuple[int, str], tuple[dict, Any]] = {}
+_LITERAL_CACHE_SIZE = 256
 
 
 def _get_literal(variable: str | Any, map_dict: dict, type_fail=False) -> int:
@@ -128,27 +157,38 @@ def _get_literal(variable: str | Any, map_dict: dict, type_fail=False) -> int:
     Returns:
         int: Integer to send to PicoSDK driver.
     """
-    if not isinstance(variable, str) and type_fail is False:
-        return variable
-    elif isinstance(variable, str):
-        variable = variable.lower()
-        if variable in map_dict:
-            return map_dict[variable]
+    if not isinstance(variable, str):
+        if type_fail is False:
+            return variable
+    else:
+        cache_key = (id(map_dict), variable)
+        cached = _LITERAL_CACHE.get(cache_key)
+        # The cached map reference keeps the id valid and guards against reuse
+        if cached is not None and cached[0] is map_dict:
+            return cached[1]
+        lowered = variable.lower()
+        if lowered in map_dict:
+            value = map_dict[lowered]
+            if len(_LITERAL_CACHE) < _LITERAL_CACHE_SIZE:
+                _LITERAL_CACHE[cache_key] = (map_dict, value)
+            return value
+        variable = lowered
     raise PicoSDKException(f'Variable \'{variable}\' not in {list(map_dict.keys())}')
 
 
 def _siggen_get_buffer_args(buffer: np.ndarray) -> tuple[ctypes.POINTER, int]:
     """
     Takes a np buffer and returns a ctypes compatible pointer and buffer length.
+    A C-contiguous int16 buffer is passed through without a copy.
 
     Args:
-        buffer (np.ndarray): numpy buffer of data (between -32767 and +32767)
+        buffer (np.ndarray | list): numpy buffer of data (between -32767 and +32767)
 
     Returns:
         tuple[ctypes.POINTER, int]: Buffer pointer and buffer length
     """
+    buffer = np.ascontiguousarray(buffer, dtype=np.int16)
     buffer_len = buffer.size
-    buffer = np.asanyarray(buffer, dtype=np.int16)
     buffer_ptr = buffer.ctypes.data_as(ctypes.POINTER(ctypes.c_int16))
     return buffer_ptr, buffer_len
 
@@ -324,6 +324,9 @@ class RANGE(IntEnum):
     V10 = 9
     V20 = 10
 
+# Range in mV indexed by RANGE. Kept as Python ints: it is only read at set_channel()
+# time (ChannelClass caches range_mv for conversions), and callers scale it to uV/nV,
+# which would overflow a fixed-width NumPy integer.
 RANGE_LIST = [10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000,
               100_000, 200_000, 500_000, 1_000_000]
 
@@ -659,6 +662,9 @@ class PICO_FIRMWARE_INFO(ctypes.Structure):
         ("updateRequired_", ctypes.c_uint16),
     ]
 
+#: NumPy structured dtype matching :class:`PICO_FIRMWARE_INFO`.
+PICO_FIRMWARE_INFO_DTYPE = np.dtype(PICO_FIRMWARE_INFO)
+
 class DIGITAL_PORT(IntEnum):
     """Digital port identifiers for the 6000A series."""
     PORT0 = 128
@@ -719,7 +725,7 @@ PicoChannelFlagsEnumMap = {
     PICO_CHANNEL_FLAGS.PORT3_FLAGS: 524288,
 }
 
-ReturnTypeMap = Literal['string', 'enum']
+ReturnTypeMap = Literal['string', 'enum', 'flags']
 
 
 class PICO_CONNECT_PROBE_RANGE(IntEnum):
@@ -762,6 +768,9 @@ class PICO_SCALING_FACTORS_VALUES(ctypes.Structure):
         ("scalingFactor_", ctypes.c_double),
     ]
 
+#: NumPy structured dtype matching :class:`PICO_SCALING_FACTORS_VALUES`.
+PICO_SCALING_FACTORS_VALUES_DTYPE = np.dtype(PICO_SCALING_FACTORS_VALUES)
+
 
 class PICO_SCALING_FACTORS_FOR_RANGE_TYPES_VALUES(ctypes.Structure):
     """Scaling factors for a probe range type."""
@@ -966,10 +975,18 @@ class PICO_TRIGGER_INFO_PS5000A(ctypes.Structure):
         ("timeStampCounter", ctypes.c_uint64),
     ]
 
+#: NumPy structured dtype matching :class:`PICO_TRIGGER_INFO`.
+PICO_TRIGGER_INFO_DTYPE = np.dtype(PICO_TRIGGER_INFO)
+#: NumPy structured dtype matching :class:`PICO_TRIGGER_INFO_PS5000A`.
+PICO_TRIGGER_INFO_PS5000A_DTYPE = np.dtype(PICO_TRIGGER_INFO_PS5000A)
+
 TIMESTAMP_COUNTER_MASK: int = (1 << 56) - 1
 """Mask for the 56-bit ``timeStampCounter`` field."""
 
 
+# The trigger structs below (PICO_TRIGGER_CHANNEL_PROPERTIES, PICO_CONDITION and
+# PICO_DIRECTION) have naturally aligned fields, so their default ctypes layout is
+# identical to the 1-byte packed layout in the PicoSDK headers without _pack_.
 class PICO_TRIGGER_CHANNEL_PROPERTIES(ctypes.Structure):
     """Trigger threshold configuration for a single channel.
 
@@ -989,8 +1006,6 @@ class PICO_TRIGGER_CHANNEL_PROPERTIES(ctypes.Structure):
             :class:`CHANNEL` value.
     """
 
-    _pack_ = 1
-
     _fields_ = [
         ("thresholdUpper_", ctypes.c_int16),
         ("thresholdUpperHysteresis_", ctypes.c_uint16),
@@ -1011,16 +1026,17 @@ class PICO_CONDITION(ctypes.Structure):
         condition_: Desired state from :class:`PICO_TRIGGER_STATE`.
     """
 
-    #: Ensure this structure matches the 1-byte packed layout used in the
-    #: PicoSDK headers.
-    _pack_ = 1
-
     _fields_ = [
         ("source_", ctypes.c_int32),
         ("condition_", ctypes.c_int32),
     ]
 
 
+#: NumPy structured dtype matching :class:`PICO_CONDITION`, for building condition arrays
+#: that are passed to the driver without a per-element copy.
+PICO_CONDITION_DTYPE = np.dtype([("source_", np.int32), ("condition_", np.int32)])
+
+
 class THRESHOLD_DIRECTION(IntEnum):
     """Enumerates trigger threshold directions used with :class:`PICO_DIRECTION`."""
 
@@ -1059,14 +1075,17 @@ class PICO_DIRECTION(ctypes.Structure):
         thresholdMode_: Threshold mode from :class:`PICO_THRESHOLD_MODE`.
     """
 
-    _pack_ = 1
-
     _fields_ = [
         ("channel_", ctypes.c_int32),
         ("direction_", ctypes.c_int32),
         ("thresholdMode_", ctypes.c_int32),
     ]
 
+
+#: NumPy structured dtype matching :class:`PICO_DIRECTION`.
+PICO_DIRECTION_DTYPE = np.dtype(
+    [("channel_", np.int32), ("direction_", np.int32), ("thresholdMode_", np.int32)])
+
 class PICO_PORT_DIGITAL_CHANNEL(IntEnum):
     """Digital channel identifiers within a port."""
 
@@ -1283,12 +1302,14 @@ __all__ = [
     '_PICO_TIME_UNIT',
     'PICO_VERSION',
     'PICO_FIRMWARE_INFO',
+    'PICO_FIRMWARE_INFO_DTYPE',
     'DIGITAL_PORT',
     'DIGITAL_PORT_HYSTERESIS',
     'PICO_CHANNEL_FLAGS',
     'PICO_CONNECT_PROBE_RANGE',
     'PICO_PROBE_RANGE_INFO',
     'PICO_SCALING_FACTORS_VALUES',
+    'PICO_SCALING_FACTORS_VALUES_DTYPE',
     'PICO_SCALING_FACTORS_FOR_RANGE_TYPES_VALUES',
     'AUXIO_MODE',
     'PICO_CHANNEL_OVERVOLTAGE_TRIPPED',
@@ -1298,12 +1319,16 @@ __all__ = [
     'PICO_STREAMING_DATA_INFO',
     'PICO_STREAMING_DATA_TRIGGER_INFO',
     'PICO_TRIGGER_INFO',
+    'PICO_TRIGGER_INFO_DTYPE',
+    'PICO_TRIGGER_INFO_PS5000A_DTYPE',
     'TIMESTAMP_COUNTER_MASK',
     'PICO_TRIGGER_CHANNEL_PROPERTIES',
     'PICO_CONDITION',
+    'PICO_CONDITION_DTYPE',
     'THRESHOLD_DIRECTION',
     'THRESHOLD_MODE',
     'PICO_DIRECTION',
+    'PICO_DIRECTION_DTYPE',
     'PICO_PORT_DIGITAL_CHANNEL',
     'DIGITAL_DIRECTION',
     'DIGITAL_CHANNEL_DIRECTIONS',
@@ -1,6 +1,7 @@
 """Copyright (C) 2025-2025 Pico Technology Ltd. See LICENSE file for terms."""
 
 import ctypes
+import numpy as np
 try:
     from typing import override  # type: ignore
 except ImportError:
@@ -25,8 +26,7 @@ class ps6000a(PicoScopeBase, shared_ps6000a_psospa, shared_4000a_6000a, Sharedps
     @override
     def open_unit(self, serial_number:str=None, resolution:RESOLUTION | resolution_literal=0) -> None:
         # If using Literals, convert to int
-        if resolution in resolution_map:
-            resolution = resolution_map[resolution]
+        resolution = resolution_map.get(resolution, resolution)
 
         super().open_unit(serial_number, resolution)
         self.min_adc_value, self.max_adc_value = super().get_adc_limits()
@@ -35,7 +35,7 @@ class ps6000a(PicoScopeBase, shared_ps6000a_psospa, shared_4000a_6000a, Sharedps
         self,
         timebase: int,
         return_type: cst.ReturnTypeMap = 'string',
-    ) -> list[list[str] | list[int]]:
+    ) -> list[list[str] | list[int]] | np.ndarray:
         """
         Get the available channel combinations at a given timebase for the ps6000a.
 
@@ -43,20 +43,27 @@ class ps6000a(PicoScopeBase, shared_ps6000a_psospa, shared_4000a_6000a, Sharedps
             timebase: Timebase to use for the channel combinations. Can be calculated using
                 either `sample_rate_to_timebase()` or `interval_to_timebase()`.
             return_type: Type of return value. Defaults to 'string'.
-                Can be 'string' or 'enum'.
+                Can be 'string', 'enum' or 'flags'.
                 If 'string', returns the channel combinations as a list of strings.
                 If 'enum', returns the channel combinations as a list of enums.
+                If 'flags', returns the raw uint32 ``PICO_CHANNEL_FLAGS`` masks as a
+                NumPy array without building any Python lists.
 
         Returns:
-            list[list[str] | list[int]]: List of channel combinations.
+            list[list[str] | list[int]] | np.ndarray: List of channel combinations.
                 Each list contains the channel combinations for a given timebase.
                 If return_type is 'string', the list contains the channel combinations as a list of
                 strings. If return_type is 'enum', the list contains the channel combinations as a
-                list of channel enum values.
+                list of channel enum values. If return_type is 'flags', a NumPy array of masks.
         """
         if self.resolution is None:
             raise PicoSDKException("Device has not been initialized, use open_unit()")
 
+        # Combinations depend only on resolution and timebase, so reuse earlier results
+        key = (self.resolution, timebase)
+        if key in self._combo_cache:
+            return self._decode_channel_combinations(self._combo_cache[key], return_type)
+
         n_combos = ctypes.c_uint32()
         self._call_attr_function(
             "ChannelCombinationsStateless",
@@ -64,28 +71,20 @@ class ps6000a(PicoScopeBase, shared_ps6000a_psospa, shared_4000a_6000a, Sharedps
             None,
             ctypes.byref(n_combos),
             self.resolution,
-            ctypes.c_uint32(timebase),
+            timebase,
         )
 
-        combo_array = (ctypes.c_uint32 * n_combos.value)()
+        combo_array = np.empty(n_combos.value, dtype=np.uint32)
         self._call_attr_function(
             "ChannelCombinationsStateless",
             self.handle,
-            ctypes.byref(combo_array),
+            ctypes.c_void_p(combo_array.ctypes.data),
             ctypes.byref(n_combos),
             self.resolution,
-            ctypes.c_uint32(timebase),
+            timebase,
         )
-        combo_array = list(combo_array)
-        channel_combinations = []
-        for n, i in enumerate(combo_array):
-            channel_combinations.append([])
-            for j in cst.PICO_CHANNEL_FLAGS:
-                if i & j == j and return_type == 'string':
-                    channel_combinations[n].append(cst.PicoChannelFlagsMap[j])
-                elif i & j == j and return_type == 'enum':
-                    channel_combinations[n].append(cst.PicoChannelFlagsEnumMap[j])
-        return channel_combinations
+        self._combo_cache[key] = combo_array
+        return self._decode_channel_combinations(combo_array, return_type)
 
     def get_accessory_info(self, channel: CHANNEL, info: UNIT_INFO) -> str:
         """Return accessory details for the given channel.
@@ -99,7 +98,6 @@ class ps6000a(PicoScopeBase, shared_ps6000a_psospa, shared_4000a_6000a, Sharedps
         """
 
         string = ctypes.create_string_buffer(16)
-        string_length = ctypes.c_int16(32)
         required_size = ctypes.c_int16(32)
 
         self._call_attr_function(
@@ -107,9 +105,9 @@ class ps6000a(PicoScopeBase, shared_ps6000a_psospa, shared_4000a_6000a, Sharedps
             self.handle,
             channel,
             string,
-            string_length,
+            len(string),
             ctypes.byref(required_size),
-            ctypes.c_uint32(info),
+            info,
         )
 
         return string.value.decode()
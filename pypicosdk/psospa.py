@@ -10,6 +10,7 @@ except ImportError:
     from typing_extensions import override  # type: ignore
 import json
 from warnings import warn
+import numpy as np
 
 from ._classes._channel_class import ChannelClass
 from . import constants as cst
@@ -46,11 +47,9 @@ class psospa(PicoScopeBase, shared_ps6000a_psospa):
             A structure containing USB power information of the opened device.
         """
         # If using Literals, convert to int
-        if resolution in resolution_map:
-            resolution = resolution_map[resolution]
+        resolution = resolution_map.get(resolution, resolution)
 
-        if serial_number is not None:
-            serial_number = serial_number.encode()
+        serial_number = self._encode_serial(serial_number)
 
         usb_power_struct = PICO_USB_POWER_DETAILS()
 
@@ -62,6 +61,8 @@ class psospa(PicoScopeBase, shared_ps6000a_psospa):
             ctypes.byref(usb_power_struct)
         )
         self.resolution = resolution
+        self._clear_query_caches()
+        self._adc_limits_cache.clear()
         self.set_all_channels_off()
         super().get_adc_limits()
         self.n_channels = self.get_variant_details()['NumberOfAnalogueChannels']
@@ -155,22 +156,34 @@ class psospa(PicoScopeBase, shared_ps6000a_psospa):
         return {"timebase": timebase.value,
                 "actual_sample_interval": (timebase.value / TIME_UNIT.PS)}
 
-    def get_scaling_values(self, n_channels: int = 8) -> list[PICO_SCALING_FACTORS_VALUES]:
+    def get_scaling_values(
+            self, n_channels: int = 8, as_array: bool = False
+        ) -> list[PICO_SCALING_FACTORS_VALUES] | np.ndarray:
         """Return probe scaling factors for each channel.
         Args:
             n_channels: Number of channel entries to retrieve.
+            as_array: If True, return a :data:`PICO_SCALING_FACTORS_VALUES_DTYPE`
+                NumPy array that the driver wrote into directly, instead of a list
+                of structures.
         Returns:
-            list[PICO_SCALING_FACTORS_VALUES]: Scaling factors for ``n_channels`` channels.
+            list[PICO_SCALING_FACTORS_VALUES] | np.ndarray: Scaling factors for
+            ``n_channels`` channels.
         """
 
         array_type = PICO_SCALING_FACTORS_VALUES * n_channels
-        values = array_type()
+        if as_array:
+            scaling = np.zeros(n_channels, dtype=PICO_SCALING_FACTORS_VALUES_DTYPE)
+            values = array_type.from_buffer(scaling)
+        else:
+            values = array_type()
         self._call_attr_function(
             "GetScalingValues",
             self.handle,
             values,
             ctypes.c_int16(n_channels),
         )
+        if as_array:
+            return scaling
         return list(values)
 
     def get_variant_details(
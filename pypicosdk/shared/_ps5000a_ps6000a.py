@@ -3,8 +3,12 @@ Copyright (C) 2025-2025 Pico Technology Ltd. See LICENSE file for terms.
 Includes shared functions between ps5000a and ps6000a.
 """
 import ctypes
+import numpy as np
 from .. import constants as cst
 
+# Channel flag bits in PICO_CHANNEL_FLAGS order, for decoding combinations in one pass
+_CHANNEL_FLAG_BITS = np.array(list(cst.PicoChannelFlagsMap), dtype=np.uint32)
+
 
 class Sharedps5000aPs6000a:
     "Shared functions between ps5000a and ps6000a"
@@ -62,3 +66,31 @@ class Sharedps5000aPs6000a:
             ctypes.byref(min_v),
         )
         return max_v.value, min_v.value
+
+    def _decode_channel_combinations(
+        self,
+        combos: np.ndarray,
+        return_type: cst.ReturnTypeMap,
+    ) -> list[list[str] | list[int]] | np.ndarray:
+        """Decode ``ChannelCombinationsStateless`` bit masks.
+
+        Every mask is tested against every flag with one vectorised comparison, so
+        only the returned list entries are built in Python.
+
+        Args:
+            combos (np.ndarray): uint32 combination masks returned by the driver.
+            return_type (str): 'string', 'enum' or 'flags' (a copy of the masks).
+
+        Returns:
+            list[list[str] | list[int]] | np.ndarray: Decoded channel combinations.
+        """
+        if return_type == 'flags':
+            return combos.copy()
+        if return_type == 'string':
+            values = list(cst.PicoChannelFlagsMap.values())
+        elif return_type == 'enum':
+            values = list(cst.PicoChannelFlagsEnumMap.values())
+        else:
+            return [[] for _ in combos]
+        hits = (combos[:, None] & _CHANNEL_FLAG_BITS) == _CHANNEL_FLAG_BITS
+        return [[values[j] for j in np.flatnonzero(row)] for row in hits]
@@ -3,9 +3,11 @@ Copyright (C) 2025-2025 Pico Technology Ltd. See LICENSE file for terms.
 """
 
 import ctypes
+import time
 import numpy as np
 
 from ..constants import *
+from .._exceptions import PicoSDKException
 
 class shared_4000a_6000a:
     """Shared methods between ps4000a and ps6000a"""
@@ -27,8 +29,7 @@ class shared_4000a_6000a:
         """
 
         status_flag = ctypes.c_int16()
-        if serial_number is not None:
-            serial_number = serial_number.encode()
+        serial_number = self._encode_serial(serial_number)
 
         self._call_attr_function(
             "OpenUnitAsync",
@@ -52,16 +53,45 @@ class shared_4000a_6000a:
         progress = ctypes.c_int16()
         complete = ctypes.c_int16()
 
-        self._call_attr_function(
-            "OpenUnitProgress",
+        # Polled in a loop, so call the cached driver function directly
+        self._error_handler(self._get_attr_function("OpenUnitProgress")(
             ctypes.byref(handle),
             ctypes.byref(progress),
             ctypes.byref(complete),
-        )
+        ))
 
         if complete.value:
             self.handle = handle
             self.resolution = getattr(self, "_pending_resolution", 0)
+            self._clear_query_caches()
+            self._adc_limits_cache.clear()
             self.get_adc_limits()
 
-        return handle.value, progress.value, complete.value
\ No newline at end of file
+        return handle.value, progress.value, complete.value
+
+    def wait_for_open_unit(
+        self,
+        poll_interval_s: float = 0.001,
+        timeout_s: float = 30.0,
+    ) -> int:
+        """Block until :meth:`open_unit_async` has finished opening the unit.
+        Polls :meth:`open_unit_progress`, sleeping between polls rather than
+        spinning, so other Python threads run while the unit opens (ctypes
+        also releases the GIL during each driver call).
+        Args:
+            poll_interval_s: Delay between progress polls in seconds.
+            timeout_s: Maximum time to wait in seconds.
+        Returns:
+            int: Handle of the opened unit.
+        Raises:
+            PicoSDKException: If the unit has not opened within ``timeout_s``.
+        """
+
+        deadline = time.monotonic() + timeout_s
+        while True:
+            handle, _, complete = self.open_unit_progress()
+            if complete:
+                return handle
+            if time.monotonic() >= deadline:
+                raise PicoSDKException("Timed out waiting for open_unit_async to complete")
+            time.sleep(poll_interval_s)
@@ -36,6 +36,10 @@ from .._exceptions import (
 
 from ._protocol import _ProtocolBase
 
+# Overvoltage status array type and length, built once rather than on every query
+_N_CHANNELS = ctypes.c_uint8(len(CHANNEL_NAMES))
+_OVERVOLTAGE_ARRAY_T = PICO_CHANNEL_OVERVOLTAGE_TRIPPED * len(CHANNEL_NAMES)
+
 class shared_ps6000a_psospa(_ProtocolBase):
     """Shared functions between ps6000a and psospa"""
     probe_scale: dict[float]
@@ -47,7 +51,10 @@ class shared_ps6000a_psospa(_ProtocolBase):
     ) -> tuple:
         """
         Gets the ADC limits for specified devices.
-        
+
+        The driver is queried once per resolution; later calls reuse the cached limits
+        and only rescale them for ``datatype``.
+
         Args:
             datatype: The datatype to update the ADC limits for.
                 If None, the last datatype will be used.
@@ -62,21 +69,24 @@ class shared_ps6000a_psospa(_ProtocolBase):
         if self.resolution is None:
             raise PicoSDKException("Device has not been initialized, use open_unit()")
 
-        min_value = ctypes.c_int16()
-        max_value = ctypes.c_int16()
-        self._call_attr_function(
-            'GetAdcLimits',
-            self.handle,
-            self.resolution,
-            ctypes.byref(min_value),
-            ctypes.byref(max_value)
-        )
+        limits = self._adc_limits_cache.get(self.resolution)
+        if limits is None:
+            min_value = ctypes.c_int16()
+            max_value = ctypes.c_int16()
+            self._call_attr_function(
+                'GetAdcLimits',
+                self.handle,
+                self.resolution,
+                ctypes.byref(min_value),
+                ctypes.byref(max_value)
+            )
+            limits = self._adc_limits_cache[self.resolution] = (min_value.value, max_value.value)
         if datatype is not None:
             self.base_dataclass.last_datatype = datatype
         datatype_scale = cst.DataTypeScaleMap.get(self.base_dataclass.last_datatype, 1)
 
-        self.min_adc_value = int(min_value.value / datatype_scale)
-        self.max_adc_value = int(max_value.value / datatype_scale)
+        self.min_adc_value = int(limits[0] / datatype_scale)
+        self.max_adc_value = int(limits[1] / datatype_scale)
         return self.min_adc_value, self.max_adc_value
 
     def get_values_bulk_async(
@@ -209,8 +219,7 @@ class shared_ps6000a_psospa(_ProtocolBase):
             dict: Returns dictionary of the actual achieved values.
         """
         # Check if typing Literal
-        if wave_type in waveform_map:
-            wave_type = waveform_map[wave_type]
+        wave_type = waveform_map.get(wave_type, wave_type)
 
         self.siggen_set_waveform(wave_type)
         self.siggen_set_range(pk2pk, offset)
@@ -270,7 +279,7 @@ class shared_ps6000a_psospa(_ProtocolBase):
         self._call_attr_function(
             'SigGenFrequency',
             self.handle,
-            ctypes.c_double(frequency)
+            frequency
         )
 
     def siggen_set_duty_cycle(self, duty:float) -> None:
@@ -283,7 +292,7 @@ class shared_ps6000a_psospa(_ProtocolBase):
         self._call_attr_function(
             'SigGenWaveformDutyCycle',
             self.handle,
-            ctypes.c_double(duty)
+            duty
         )
 
     def siggen_set_range(self, pk2pk:float, offset:float=0.0):
@@ -297,8 +306,8 @@ class shared_ps6000a_psospa(_ProtocolBase):
         self._call_attr_function(
             'SigGenRange',
             self.handle,
-            ctypes.c_double(pk2pk),
-            ctypes.c_double(offset)
+            pk2pk,
+            offset
         )
 
     def siggen_set_waveform(
@@ -671,7 +680,7 @@ class shared_ps6000a_psospa(_ProtocolBase):
         self._call_attr_function(
             "MemorySegmentsBySamples",
             self.handle,
-            ctypes.c_uint64(n_samples),
+            n_samples,
             ctypes.byref(max_segments),
         )
         return max_segments.value
@@ -705,8 +714,8 @@ class shared_ps6000a_psospa(_ProtocolBase):
         self._call_attr_function(
             "QueryMaxSegmentsBySamples",
             self.handle,
-            ctypes.c_uint64(n_samples),
-            ctypes.c_uint32(n_channel_enabled),
+            n_samples,
+            n_channel_enabled,
             ctypes.byref(max_segments),
             self.resolution,
         )
@@ -719,13 +728,12 @@ class shared_ps6000a_psospa(_ProtocolBase):
             list[PICO_CHANNEL_OVERVOLTAGE_TRIPPED]: Trip status for all channels.
         """
 
-        n_channels = len(CHANNEL_NAMES)
-        status_array = (PICO_CHANNEL_OVERVOLTAGE_TRIPPED * n_channels)()
+        status_array = _OVERVOLTAGE_ARRAY_T()
         self._call_attr_function(
             "ResetChannelsAndReportAllChannelsOvervoltageTripStatus",
             self.handle,
             status_array,
-            ctypes.c_uint8(n_channels),
+            _N_CHANNELS,
         )
 
         return list(status_array)
@@ -733,7 +741,7 @@ class shared_ps6000a_psospa(_ProtocolBase):
     def set_digital_port_on(
         self,
         port: DIGITAL_PORT,
-        logic_threshold_level: list[int],
+        logic_threshold_level: list[int] | np.ndarray,
         hysteresis: DIGITAL_PORT_HYSTERESIS,
     ) -> None:
         """Enable a digital port using ``ps6000aSetDigitalPortOn``.
@@ -744,18 +752,18 @@ class shared_ps6000a_psospa(_ProtocolBase):
             hysteresis: Hysteresis level applied to all pins.
         """
 
-        level_array = (ctypes.c_int16 * len(logic_threshold_level))(
-            *logic_threshold_level
-        )
+        # Converted in one NumPy pass; the driver reads straight from its memory
+        level_array = np.ascontiguousarray(logic_threshold_level, dtype=np.int16)
 
         self._call_attr_function(
             "SetDigitalPortOn",
             self.handle,
             port,
-            level_array,
-            len(logic_threshold_level),
+            ctypes.c_void_p(level_array.ctypes.data),
+            len(level_array),
             hysteresis,
         )
+        self._clear_query_caches()
 
     def set_digital_port_off(self, port: DIGITAL_PORT) -> None:
         """Disable a digital port using ``ps6000aSetDigitalPortOff``."""
@@ -765,6 +773,7 @@ class shared_ps6000a_psospa(_ProtocolBase):
             self.handle,
             port,
         )
+        self._clear_query_caches()
 
     def get_maximum_available_memory(self) -> int:
         """Return the maximum sample depth for the current resolution.
@@ -799,15 +808,13 @@ class shared_ps6000a_psospa(_ProtocolBase):
             channels.
         """
 
-        n_channels = len(CHANNEL_NAMES)
-        array_type = PICO_CHANNEL_OVERVOLTAGE_TRIPPED * n_channels
-        status_array = array_type()
+        status_array = _OVERVOLTAGE_ARRAY_T()
 
         self._call_attr_function(
             "ReportAllChannelsOvervoltageTripStatus",
             self.handle,
             status_array,
-            n_channels,
+            _N_CHANNELS,
         )
 
         return list(status_array)
@@ -53,6 +53,7 @@ class StreamingScope:
         self.np_buffer = np.empty(0)
         self.buffer_index = 0
         self.buffer = np.empty(0)
+        self._midpoint = np.empty(0)
         self.samples: int
         self.np_samples: int
         self.max_buffer_size: int
@@ -273,6 +274,26 @@ class StreamingScope:
                 self.buffer = (np.concatenate([temp_pad_array, self.buffer, new_data])
                                [-self.max_buffer_size:])
 
+    def get_aggregate_midpoint(self) -> np.ndarray:
+        """
+        Returns the midpoint of the AGGREGATE max/min buffers.
+
+        The sum and halving are done in place on a reused array, so live plots
+        can call this every frame without allocating temporaries.
+
+        Returns:
+            numpy.ndarray: (max + min) / 2 for each buffered sample. The array
+                is reused and overwritten by the next call.
+        """
+        if self.ratio_mode != RATIO_MODE.AGGREGATE:
+            raise PicoSDKException(
+                'Midpoint is only available with RATIO_MODE.AGGREGATE.')
+        if self._midpoint.shape != self.buffer[0].shape:
+            self._midpoint = np.empty_like(self.buffer[0])
+        np.add(self.buffer[0], self.buffer[1], out=self._midpoint)
+        self._midpoint *= 0.5
+        return self._midpoint
+
     def start_streaming_while(self) -> None:
         """
         Starts and continuously runs the streaming acquisition loop until
@@ -3,7 +3,8 @@ Copyright (C) 2025-2025 Pico Technology Ltd. See LICENSE file for terms.
 
 pytest file for checking the mv/adc conversions
 """
-from pypicosdk import ps6000a, RANGE, CHANNEL
+import numpy as np
+from pypicosdk import ps6000a, RANGE, RANGE_LIST, CHANNEL
 from pypicosdk._classes._channel_class import ChannelClass
 channel = CHANNEL.A
 
@@ -16,6 +17,14 @@ def test_ps6000a_mv_to_adc():
     assert scope.mv_to_adc(5.0, channel) == 160
 
 
+def test_ps6000a_mv_to_adc_probe_scaled():
+    """Test mv_to_adc applies the channel probe scaling"""
+    scope = ps6000a('pytest')
+    scope.max_adc_value = 32000
+    scope.channel_db[channel] = ChannelClass(RANGE.V1, 10)
+    assert scope.mv_to_adc(50.0, channel) == 160
+
+
 def test_ps6000a_volts_to_adc():
     """Test mv_to_adc function"""
     scope = ps6000a('pytest')
@@ -30,3 +39,39 @@ def test_ps6000a_adc_to_mv():
     scope.max_adc_value = 32000
     scope.channel_db[channel] = ChannelClass(RANGE.V1, 1)
     assert scope.adc_to_mv(160, 0) == 5.0
+
+
+def test_ps6000a_adc_to_mv_array():
+    """Test adc_to_mv on a numpy buffer"""
+    scope = ps6000a('pytest')
+    scope.max_adc_value = 32000
+    scope.channel_db[channel] = ChannelClass(RANGE.V1, 10)
+    mv = scope.adc_to_mv(np.array([-32000, 0, 160], dtype=np.int16), channel)
+    assert np.allclose(mv, [-10000.0, 0.0, 50.0])
+
+
+def test_ps6000a_adc_to_float32():
+    """Test channel buffer conversion into float32"""
+    scope = ps6000a('pytest')
+    scope.max_adc_value = 32000
+    scope.channel_db[channel] = ChannelClass(RANGE.V1, 1)
+    buffers = scope._adc_to_({channel: np.array([160, -32000], dtype=np.int16)}, dtype=np.float32)
+    assert buffers[channel].dtype == np.float32
+    assert buffers[channel].tolist() == [5.0, -1000.0]
+
+
+def test_ps6000a_adc_to_mv_out():
+    """Test adc_to_mv writing into a preallocated array"""
+    scope = ps6000a('pytest')
+    scope.max_adc_value = 32000
+    scope.channel_db[channel] = ChannelClass(RANGE.V1, 1)
+    out = np.empty(2, dtype=np.float32)
+    result = scope.adc_to_mv(np.array([160, -32000], dtype=np.int16), channel, out=out)
+    assert result is out
+    assert out.tolist() == [5.0, -1000.0]
+
+
+def test_range_list_scales_without_overflow():
+    """RANGE_LIST entries stay Python ints so uV/nV scaling cannot overflow"""
+    assert RANGE_LIST[-1] * 1_000_000 == 10 ** 12
+    assert ChannelClass(RANGE.V1, 1).range_mv == 1000
@@ -0,0 +1,305 @@
+"""Copyright (C) 2025-2025 Pico Technology Ltd. See LICENSE file for terms."""
+
+import ctypes
+import numpy as np
+import pytest
+from pypicosdk import ps6000a, ACTION, CHANNEL, RANGE, RATIO_MODE, PicoSDKException
+from pypicosdk._classes._channel_class import ChannelClass
+
+
+def test_rapid_buffers_clear_once():
+    scope = ps6000a('pytest')
+    limit_calls = []
+    scope.get_adc_limits = lambda *args, **kwargs: limit_calls.append(args)
+    calls = []
+    class FakeDll:
+        def __getattr__(self, name):
+            return lambda *args: calls.append(args) or 0
+    scope.dll = FakeDll()
+    scope.channel_db[CHANNEL.A] = ChannelClass(RANGE.V1, 1)
+    scope.channel_db[CHANNEL.B] = ChannelClass(RANGE.V1, 1)
+    buffers = scope.set_data_buffer_for_enabled_channels(100, captures=3)
+    assert [args[-1] for args in calls] == [ACTION.CLEAR_ALL | ACTION.ADD] + [ACTION.ADD] * 5
+    assert len(limit_calls) == 1
+    assert buffers[CHANNEL.A].shape == (3, 100)
+    assert [args[2].value for args in calls[:3]] == \
+        [buffers[CHANNEL.A][i].ctypes.data for i in range(3)]
+
+
+def test_rapid_aggregate_buffers_register_min_max_rows():
+    scope = ps6000a('pytest')
+    calls = []
+    class FakeDll:
+        def __getattr__(self, name):
+            return lambda *args: calls.append((name, args)) or 0
+    scope.dll = FakeDll()
+    buffer = scope.set_data_buffer_rapid_capture(
+        CHANNEL.A, 10, 2, ratio_mode=RATIO_MODE.AGGREGATE,
+        buffer=np.zeros((2, 2, 10), dtype=np.int16))
+    name, args = calls[1]
+    assert name == 'ps6000aSetDataBuffers'
+    assert args[2].value == buffer[1, 1].ctypes.data
+    assert args[3].value == buffer[1, 0].ctypes.data
+
+
+def test_rapid_aggregate_buffer_has_min_max_plane_per_capture():
+    scope = ps6000a('pytest')
+    scope.get_adc_limits = lambda *args: None
+    class FakeDll:
+        def __getattr__(self, name):
+            def call(handle, channel, max_ptr, min_ptr, samples, datatype, segment, *args):
+                # Write the segment index as max and its negative as min, as the driver would
+                ctypes.memmove(max_ptr, np.full(samples.value, segment, np.int16).ctypes.data,
+                               2 * samples.value)
+                ctypes.memmove(min_ptr, np.full(samples.value, -segment, np.int16).ctypes.data,
+                               2 * samples.value)
+                return 0
+            return call
+    scope.dll = FakeDll()
+    buffer = scope.set_data_buffer_rapid_capture(
+        CHANNEL.A, 4, 3, ratio_mode=RATIO_MODE.AGGREGATE)
+    assert buffer.shape == (3, 2, 4)
+    for i in range(3):
+        assert buffer[i, 0].tolist() == [-i] * 4
+        assert buffer[i, 1].tolist() == [i] * 4
+
+
+def test_time_axis_reuses_timebase_interval():
+    scope = ps6000a('pytest')
+    calls = []
+    def call(name, *args):
+        calls.append(name)
+        args[3]._obj.value = 0.8
+    scope._call_attr_function = call
+    first = scope.get_time_axis(3, 5, pre_trig_percent=0)
+    second = scope.get_time_axis(3, 5, pre_trig_percent=0, dtype=np.float32)
+    assert calls == ['GetTimebase']
+    assert np.allclose(first, [0.0, 0.8, 1.6, 2.4, 3.2])
+    assert second.dtype == np.float32
+
+
+def test_set_data_buffer_passes_numpy_memory():
+    scope = ps6000a('pytest')
+    pointers = []
+    scope._call_attr_function = lambda name, *args: pointers.append(args[2].value)
+    buffer = np.zeros((2, 100), dtype=np.int16)
+    scope.set_data_buffer(CHANNEL.A, 100, segment=1, buffer=buffer[1])
+    assert pointers == [buffer[1].ctypes.data]
+
+
+def test_block_capture_adc_returns_driver_buffer():
+    scope = ps6000a('pytest')
+    registered = {}
+    def set_buffers(samples, segment, datatype, ratio_mode):
+        registered[CHANNEL.A] = np.arange(samples, dtype=np.int16)
+        return dict(registered)
+    scope.set_data_buffer_for_enabled_channels = set_buffers
+    scope.run_block_capture = lambda *args: None
+    scope.get_values = lambda *args: 8
+    scope.get_time_axis = lambda *args, **kwargs: None
+    buffers, _ = scope.run_simple_block_capture(3, 10, output_unit='adc')
+    assert buffers[CHANNEL.A].dtype == np.int16
+    assert buffers[CHANNEL.A].shape == (8,)
+    assert np.shares_memory(buffers[CHANNEL.A], registered[CHANNEL.A])
+
+
+def test_block_capture_writes_into_out():
+    scope = ps6000a('pytest')
+    scope.max_adc_value = 32000
+    scope.channel_db[CHANNEL.A] = ChannelClass(RANGE.V1, 1)
+    scope.set_data_buffer_for_enabled_channels = \
+        lambda samples, *args: {CHANNEL.A: np.full(samples, 160, dtype=np.int16)}
+    scope.run_block_capture = lambda *args: None
+    scope.get_values = lambda *args: 8
+    scope.get_time_axis = lambda *args, **kwargs: None
+    out = {CHANNEL.A: np.zeros(10, dtype=np.float32)}
+    buffers, _ = scope.run_simple_block_capture(3, 10, out=out)
+    assert np.shares_memory(buffers[CHANNEL.A], out[CHANNEL.A])
+    assert out[CHANNEL.A].tolist() == [5.0] * 8 + [0.0] * 2
+
+
+def test_block_capture_keeps_float64_time_axis():
+    scope = ps6000a('pytest')
+    scope.max_adc_value = 32000
+    scope.channel_db[CHANNEL.A] = ChannelClass(RANGE.V1, 1)
+    scope.set_data_buffer_for_enabled_channels = \
+        lambda samples, *args: {CHANNEL.A: np.full(samples, 160, dtype=np.int16)}
+    scope.run_block_capture = lambda *args: None
+    scope.get_values = lambda *args: 4
+    scope.get_timebase = lambda *args: {'Interval(ns)': 0.2}
+    buffers, time_axis = scope.run_simple_block_capture(3, 4, pre_trig_percent=0)
+    assert buffers[CHANNEL.A].dtype == np.float32
+    assert time_axis.dtype == np.float64
+
+
+def test_attr_function_resolved_once():
+    scope = ps6000a('pytest')
+    lookups = []
+    class FakeDll:
+        def __getattr__(self, name):
+            lookups.append(name)
+            return lambda *args: 0
+    scope.dll = FakeDll()
+    scope.ping_unit()
+    scope.ping_unit()
+    assert lookups == ['ps6000aPingUnit']
+
+
+def test_attr_function_sets_registered_argtypes():
+    scope = ps6000a('pytest')
+    class FakeFunction:
+        argtypes = None
+        def __call__(self, *args):
+            return 0
+    class FakeDll:
+        def __getattr__(self, name):
+            return FakeFunction()
+    scope.dll = FakeDll()
+    assert scope._get_attr_function('MemorySegments').argtypes[1] is ctypes.c_uint64
+    assert scope._get_attr_function('FlashLed').argtypes is None
+
+
+def test_channel_combinations_decode():
+    scope = ps6000a('pytest')
+    scope.resolution = 0
+    calls = []
+    def call(name, handle, combos, n_combos, *args):
+        calls.append(name)
+        n_combos._obj.value = 2
+        if combos is not None:
+            ctypes.memmove(combos.value, np.array([3, 65537], dtype=np.uint32).ctypes.data, 8)
+    scope._call_attr_function = call
+    assert scope.get_channel_combinations(3) == [['A', 'B'], ['A', 'PORT0']]
+    assert scope.get_channel_combinations(3, 'enum') == [[0, 1], [0, 65536]]
+    assert scope.get_channel_combinations(3, 'flags').tolist() == [3, 65537]
+    assert len(calls) == 2
+
+
+def test_minimum_timebase_cached_per_channel_setup():
+    scope = ps6000a('pytest')
+    scope.resolution = 0
+    calls = []
+    def call(name, handle, flags, timebase, interval, resolution):
+        calls.append(flags)
+        timebase._obj.value = flags
+    scope._call_attr_function = call
+    scope.channel_db[CHANNEL.A] = ChannelClass(RANGE.V1, 1)
+    assert scope.get_minimum_timebase_stateless()['timebase'] == 1
+    assert scope.get_minimum_timebase_stateless()['timebase'] == 1
+    scope.channel_db[CHANNEL.B] = ChannelClass(RANGE.V1, 1)
+    assert scope.get_minimum_timebase_stateless()['timebase'] == 3
+    assert calls == [1, 3]
+
+
+def test_block_capture_recycles_driver_buffers():
+    scope = ps6000a('pytest')
+    scope.max_adc_value = 32000
+    scope.get_adc_limits = lambda *args: None
+    pointers = []
+    scope._call_attr_function = lambda name, *args: pointers.append(args[2].value)
+    scope.run_block_capture = lambda *args: None
+    scope.get_values = lambda *args: 10
+    scope.get_time_axis = lambda *args, **kwargs: None
+    scope.channel_db[CHANNEL.A] = ChannelClass(RANGE.V1, 1)
+    first, _ = scope.run_simple_block_capture(3, 10)
+    second, _ = scope.run_simple_block_capture(3, 10)
+    assert pointers[0] == pointers[1]
+    assert not np.shares_memory(first[CHANNEL.A], second[CHANNEL.A])
+    adc, _ = scope.run_simple_block_capture(3, 10, output_unit='adc')
+    assert adc[CHANNEL.A].ctypes.data == pointers[0]
+    assert not scope._buffer_pool[((10,), np.dtype(np.int16))]
+
+
+def test_release_buffer_keeps_latest_shape_only():
+    scope = ps6000a('pytest')
+    scope.release_buffer(np.zeros(10, dtype=np.int16))
+    scope.release_buffer(np.zeros(20, dtype=np.int16))
+    assert list(scope._buffer_pool) == [((20,), np.dtype(np.int16))]
+    reused = scope._new_buffer(20, np.int16)
+    assert not reused.any()
+    assert not scope._buffer_pool[((20,), np.dtype(np.int16))]
+
+
+def test_resolution_change_only_requeries_adc_limits_on_change():
+    scope = ps6000a('pytest')
+    scope.resolution = 0
+    calls = []
+    scope._call_attr_function = lambda name, *args: calls.append(name)
+    scope.get_adc_limits = lambda *args: calls.append('limits')
+    scope.set_device_resolution(0)
+    assert calls == []
+    scope.set_device_resolution(1)
+    assert calls == ['SetDeviceResolution', 'limits']
+    scope.get_device_resolution()
+    assert calls[2:] == ['GetDeviceResolution', 'limits']
+    scope.get_device_resolution()
+    assert calls[4:] == ['GetDeviceResolution']
+
+
+def test_polling_wrappers_call_driver_directly():
+    scope = ps6000a('pytest')
+    class FakeDll:
+        def __getattr__(self, name):
+            def call(handle, count):
+                count._obj.value = 42
+                return 0
+            return call
+    scope.dll = FakeDll()
+    scope._call_attr_function = None
+    assert scope.no_of_streaming_values() == 42
+    assert scope.get_no_of_processed_captures() == 42
+
+
+def test_adc_limits_queried_once_per_resolution():
+    scope = ps6000a('pytest')
+    calls = []
+    def call(name, handle, resolution, min_value, max_value):
+        calls.append(resolution)
+        min_value._obj.value, max_value._obj.value = -32512, 32512
+    scope._call_attr_function = call
+    for resolution in (0, 0, 1, 0):
+        scope.resolution = resolution
+        assert scope.get_adc_limits() == (-32512, 32512)
+    assert calls == [0, 1]
+
+
+def test_trigger_time_offsets_as_array():
+    scope = ps6000a('pytest')
+    def call(name, handle, times, units, first, last):
+        for i in range(last - first + 1):
+            times[i], units[i] = 100 * i, 2
+    scope._call_attr_function = call
+    times, units = scope.get_values_trigger_time_offset_bulk(0, 2, as_array=True)
+    assert times.dtype == np.int64 and units.dtype == np.int32
+    assert times.tolist() == [0, 100, 200]
+    assert scope.get_values_trigger_time_offset_bulk(0, 1)[1] == (100, 2)
+
+
+def test_siggen_buffer_args_skip_copy_when_contiguous():
+    from pypicosdk.common import _siggen_get_buffer_args
+    buffer = np.arange(8, dtype=np.int16)
+    ptr, length = _siggen_get_buffer_args(buffer)
+    assert length == 8
+    assert ctypes.cast(ptr, ctypes.c_void_p).value == buffer.ctypes.data
+    ptr, length = _siggen_get_buffer_args(buffer[::2])
+    assert length == 4 and ptr[1] == 2
+    ptr, length = _siggen_get_buffer_args([1, 2, 3])
+    assert length == 3 and ptr[2] == 3
+
+
+@pytest.mark.parametrize('ratio_mode, buffer', [
+    (RATIO_MODE.RAW, np.zeros((1, 10), dtype=np.int16)),           # Too few captures
+    (RATIO_MODE.AGGREGATE, np.zeros((3, 10, 2), dtype=np.int16)),  # Old interleaved layout
+    (RATIO_MODE.RAW, np.zeros((3, 10), dtype=np.int8)),            # Wrong dtype
+])
+def test_rapid_buffer_rejects_mismatched_buffer(ratio_mode, buffer):
+    scope = ps6000a('pytest')
+    calls = []
+    class FakeDll:
+        def __getattr__(self, name):
+            return lambda *args: calls.append(name) or 0
+    scope.dll = FakeDll()
+    with pytest.raises(PicoSDKException):
+        scope.set_data_buffer_rapid_capture(
+            CHANNEL.A, 10, 3, ratio_mode=ratio_mode, buffer=buffer)
+    assert calls == []
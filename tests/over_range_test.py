@@ -7,4 +7,15 @@ def test_adc_to_mv():
     warnings.simplefilter("ignore", OverrangeWarning)
     scope = ps6000a('pytest')
     scope.over_range = 255
-    assert scope.is_over_range() == ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
\ No newline at end of file
+    assert scope.is_over_range() == ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
+
+def test_get_values_bulk_overflow():
+    warnings.simplefilter("ignore", OverrangeWarning)
+    scope = ps6000a('pytest')
+    scope.is_ready = lambda: None
+    def call(name, *args):
+        args[-1][2] = 0b101
+    scope._call_attr_function = call
+    _, overflow = scope.get_values_bulk(100, 0, 3)
+    assert overflow == [[], [], ['A', 'C'], []]
+    assert scope.over_range == 0
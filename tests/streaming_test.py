@@ -0,0 +1,14 @@
+"""Copyright (C) 2025-2025 Pico Technology Ltd. See LICENSE file for terms."""
+
+import numpy as np
+from pypicosdk import ps6000a, RATIO_MODE
+from pypicosdk.streaming import StreamingScope
+
+
+def test_aggregate_midpoint():
+    stream = StreamingScope(ps6000a('pytest'))
+    stream.ratio_mode = RATIO_MODE.AGGREGATE
+    stream.buffer = np.array([[10.0, 4.0, -2.0], [2.0, 0.0, -6.0]])
+    midpoint = stream.get_aggregate_midpoint()
+    assert midpoint.tolist() == [6.0, 2.0, -4.0]
+    assert stream.get_aggregate_midpoint() is midpoint
@@ -0,0 +1,67 @@
+"""Copyright (C) 2025-2025 Pico Technology Ltd. See LICENSE file for terms."""
+
+import ctypes
+import numpy as np
+from pypicosdk import (
+    PICO_CONDITION, PICO_DIRECTION, PICO_TRIGGER_CHANNEL_PROPERTIES, PICO_CONDITION_DTYPE,
+    PICO_TRIGGER_INFO_DTYPE, CHANNEL, THRESHOLD_DIRECTION, THRESHOLD_MODE,
+    TRIGGER_STATE, ps6000a, psospa)
+from pypicosdk.base import _condition_array, _direction_array
+
+
+def test_trigger_struct_layout_matches_packed_header():
+    for struct in (PICO_CONDITION, PICO_DIRECTION, PICO_TRIGGER_CHANNEL_PROPERTIES):
+        class Packed(ctypes.Structure):
+            _pack_ = 1
+            _fields_ = struct._fields_
+        assert ctypes.sizeof(struct) == ctypes.sizeof(Packed)
+        for name, _ in struct._fields_:
+            assert getattr(struct, name).offset == getattr(Packed, name).offset
+
+
+def test_condition_array_from_structured_ndarray():
+    conditions = np.array([(0, 1), (2, 2)], dtype=PICO_CONDITION_DTYPE)
+    from_ndarray = _condition_array(conditions)
+    from_list = _condition_array([(0, 1), (2, 2)])
+    assert bytes(from_ndarray) == bytes(from_list)
+    assert from_ndarray[1].source_ == 2
+
+
+def test_direction_array_from_lists():
+    directions = _direction_array([0, 1], [2, 3], [0, 1])
+    assert [(d.channel_, d.direction_, d.thresholdMode_) for d in directions] == [(0, 2, 0), (1, 3, 1)]
+
+
+def test_direction_array_from_enums():
+    assert THRESHOLD_DIRECTION(2) is THRESHOLD_DIRECTION.RISING is THRESHOLD_DIRECTION.NONE
+    directions = _direction_array(
+        [CHANNEL.A], [THRESHOLD_DIRECTION.FALLING], [THRESHOLD_MODE.WINDOW])
+    assert (directions[0].direction_, directions[0].thresholdMode_) == (3, 1)
+
+
+def test_trigger_state_and_mode_are_enums():
+    assert TRIGGER_STATE(1) is TRIGGER_STATE.TRUE
+    assert THRESHOLD_MODE.WINDOW.name == 'WINDOW'
+    conditions = _condition_array([(CHANNEL.B, TRIGGER_STATE.FALSE)])
+    assert (conditions[0].source_, conditions[0].condition_) == (1, 2)
+
+
+def test_scaling_values_as_array():
+    scope = psospa('pytest')
+    def call(name, handle, values, n_channels):
+        values[1].scalingFactor_ = 2.5
+    scope._call_attr_function = call
+    scaling = scope.get_scaling_values(2, as_array=True)
+    assert scaling['scalingFactor_'].tolist() == [0.0, 2.5]
+
+
+def test_trigger_info_as_array():
+    scope = ps6000a('pytest')
+    def call(name, handle, info, first, last):
+        info._obj[1].triggerIndex_ = 7
+        info._obj[1].timeStampCounter_ = 1 << 40
+    scope._call_attr_function = call
+    info = scope.get_trigger_info(0, 2, as_array=True)
+    assert info.dtype == PICO_TRIGGER_INFO_DTYPE
+    assert info['triggerIndex_'].tolist() == [0, 7]
+    assert info['timeStampCounter_'][1] == 1 << 40